@@ -3,6 +3,7 @@
 # License: MIT License
 from typing import Iterable, Sequence, Iterator
 import cython
+import numpy as np
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from .vector cimport Vec3, isclose, v3_mul, v3_sub
 
@@ -60,6 +61,10 @@ cdef class Basis:
     cdef tuple weights_  # public attribute for Cython Evaluator
     # private:
     cdef double *_knots
+    cdef double *_weights  # NULL for non-rational B-splines
+    # reciprocal knot distances: 1 / (knots[i + j] - knots[i]) at index
+    # [j * knot_count + i], 0 for coincident knots
+    cdef double *_inv_dknots
     cdef int knot_count
 
     def __cinit__(
@@ -89,9 +94,27 @@ cdef class Basis:
         for i in range(self.knot_count):
             self._knots[i] = knots[i]
         self.max_t = self._knots[self.knot_count - 1]
+        self._weights = NULL
+        if self.weights_:
+            self._weights = <double *> PyMem_Malloc(self.count * sizeof(double))
+            for i in range(self.count):
+                self._weights[i] = self.weights_[i]
+        self._inv_dknots = <double *> PyMem_Malloc(
+            self.order * self.knot_count * sizeof(double)
+        )
+        cdef int j
+        cdef double delta
+        reset_double_array(self._inv_dknots, self.order * self.knot_count, 0.0)
+        for j in range(1, self.order):
+            for i in range(self.knot_count - j):
+                delta = self._knots[i + j] - self._knots[i]
+                if delta != 0.0:
+                    self._inv_dknots[j * self.knot_count + i] = 1.0 / delta
 
     def __dealloc__(self):
         PyMem_Free(self._knots)
+        PyMem_Free(self._weights)
+        PyMem_Free(self._inv_dknots)
 
     @property
     def degree(self) -> int:
@@ -152,17 +175,31 @@ cdef class Basis:
             return span - 1
 
     cpdef list basis_funcs(self, int span, double u):
+        cdef double[MAX_SPLINE_ORDER] N
+        self._basis_funcs(span, u, N)
+        cdef list result = [x for x in N[:self.order]]
+        if self.is_rational:
+            return self.span_weighting(result, span)
+        else:
+            return result
+
+    cdef int _basis_funcs(self, int span, double u, double *N) except -1:
         # Source: The NURBS Book: Algorithm A2.2
+        # Stores the non-rational basis functions in the C array N.
         cdef int order = self.order
         cdef double *knots = self._knots
-        cdef double[MAX_SPLINE_ORDER] N, left, right
-        cdef list result
+        cdef double[MAX_SPLINE_ORDER] left, right
         reset_double_array(N, order, 0.0)
         reset_double_array(left, order, 0.0)
         reset_double_array(right, order, 0.0)
 
         cdef int j, r, i1
-        cdef double temp, saved, temp_r, temp_l
+        cdef double temp, saved, temp_r, temp_l, inv
+        # The denominators right[r + 1] + left[j - r] are the knot distances
+        # knots[span + 1 + r] - knots[span + 1 - j + r], multiply by the
+        # precomputed reciprocal values inside the valid parameter range:
+        cdef bint use_inv_dknots = span >= order - 1
+        cdef double *inv_dknots = self._inv_dknots + span + 1
         N[0] = 1.0
         for j in range(1, order):
             i1 = span + 1 - j
@@ -174,15 +211,17 @@ cdef class Basis:
             for r in range(j):
                 temp_r = right[r + 1]
                 temp_l = left[j - r]
-                temp = N[r] / (temp_r + temp_l)
+                if use_inv_dknots:
+                    inv = inv_dknots[j * self.knot_count - j + r]
+                    if inv == 0.0:
+                        raise ZeroDivisionError("float division by zero")
+                    temp = N[r] * inv
+                else:
+                    temp = N[r] / (temp_r + temp_l)
                 N[r] = saved + temp_r * temp
                 saved = temp_l * temp
             N[j] = saved
-        result = [x for x in N[:order]]
-        if self.is_rational:
-            return self.span_weighting(result, span)
-        else:
-            return result
+        return 0
 
     cpdef list span_weighting(self, nbasis: list[float], int span):
         cdef list products = [
@@ -304,37 +343,142 @@ cdef class Evaluator:
     """ B-spline curve point and curve derivative evaluator. """
     cdef Basis _basis
     cdef tuple _control_points
+    # control points as C array of x, y, z coordinates for point():
+    cdef double *_xyz
+    cdef int _count
 
     def __cinit__(self, basis: Basis, control_points: Sequence[Vec3]):
         self._basis = basis
         self._control_points = Vec3.tuple(control_points)
+        self._count = len(self._control_points)
+        self._xyz = <double *> PyMem_Malloc(self._count * 3 * sizeof(double))
+        cdef Vec3 cpoint
+        cdef int i
+        for i in range(self._count):
+            cpoint = <Vec3> self._control_points[i]
+            self._xyz[i * 3] = cpoint.x
+            self._xyz[i * 3 + 1] = cpoint.y
+            self._xyz[i * 3 + 2] = cpoint.z
+
+    def __dealloc__(self):
+        PyMem_Free(self._xyz)
 
     cpdef Vec3 point(self, double u):
-        # Source: The NURBS Book: Algorithm A3.1
         cdef Basis basis = self._basis
         if isclose(u, basis.max_t, REL_TOL, ABS_TOL):
             u = basis.max_t
+        return self._point(u, basis.find_span(u))
+
+    cdef Vec3 _point(self, double u, int span):
+        cdef Vec3 v3_sum = Vec3()
+        cdef double[3] xyz
+        self._eval(u, span, xyz)
+        v3_sum.x = xyz[0]
+        v3_sum.y = xyz[1]
+        v3_sum.z = xyz[2]
+        return v3_sum
+
+    cdef int _eval(self, double u, int span, double *result) except -1:
+        # Source: The NURBS Book: Algorithm A3.1
+        # Stores the x, y, z coordinates of the curve point in result.
+        cdef Basis basis = self._basis
         cdef:
             int p = basis.order - 1
-            int span = basis.find_span(u)
-            list N = basis.basis_funcs(span, u)
-            int i
-            Vec3 cpoint, v3_sum = Vec3()
-            tuple control_points = self._control_points
+            double[MAX_SPLINE_ORDER] N
+            int i, index
+            double *xyz = self._xyz
             double factor
-            
+            double x = 0.0, y = 0.0, z = 0.0
+
+        # evaluate the basis functions in C without creating Python objects
+        basis._basis_funcs(span, u, N)
+        if basis._weights != NULL:
+            return self._eval_rational(span, N, result)
         for i in range(p + 1):
-            factor = <double> N[i]
-            cpoint = <Vec3> control_points[span - p + i]
-            v3_sum.x += cpoint.x * factor
-            v3_sum.y += cpoint.y * factor
-            v3_sum.z += cpoint.z * factor
-        return v3_sum
+            factor = N[i]
+            index = span - p + i
+            if index < 0:  # same index wrap around as for Python sequences
+                index += self._count
+            index *= 3
+            x += xyz[index] * factor
+            y += xyz[index + 1] * factor
+            z += xyz[index + 2] * factor
+        result[0] = x
+        result[1] = y
+        result[2] = z
+        return 0
+
+    cdef int _eval_rational(self, int span, double *N, double *result) except -1:
+        # Applies the weights and the control points in a single pass by
+        # homogeneous coordinates (x*w, y*w, z*w, w), same result as
+        # span_weighting() and the non-rational evaluation.
+        cdef:
+            int p = self._basis.order - 1
+            int i, index
+            double *xyz = self._xyz
+            double *weights = self._basis._weights
+            double factor
+            double x = 0.0, y = 0.0, z = 0.0, w = 0.0
+
+        result[0] = 0.0
+        result[1] = 0.0
+        result[2] = 0.0
+        if span < p:  # outside the valid parameter range
+            return 0
+        for i in range(p + 1):
+            index = span - p + i
+            factor = N[i] * weights[index]
+            w += factor
+            index *= 3
+            x += xyz[index] * factor
+            y += xyz[index + 1] * factor
+            z += xyz[index + 2] * factor
+        if w != 0.0:
+            result[0] = x / w
+            result[1] = y / w
+            result[2] = z / w
+        return 0
 
     def points(self, t: Iterable[float]) -> Iterator[Vec3]:
+        cdef Basis basis = self._basis
+        cdef double *knots = basis._knots
+        cdef double max_t = basis.max_t
+        cdef int span = -1
         cdef double u
+        cdef list result = []
         for u in t:
-            yield self.point(u)
+            if isclose(u, max_t, REL_TOL, ABS_TOL):
+                u = max_t
+            # ascending parameters share the knot span of the previous point
+            if span < 0 or not (knots[span] <= u < knots[span + 1]):
+                span = basis.find_span(u)
+            result.append(self._point(u, span))
+        return iter(result)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def points_array(self, t: Iterable[float]) -> np.ndarray:
+        cdef Basis basis = self._basis
+        cdef double *knots = basis._knots
+        cdef double max_t = basis.max_t
+        cdef int span = -1
+        cdef double u
+        cdef double[::1] params
+        if isinstance(t, np.ndarray):  # avoid iteration by Python floats
+            params = np.ascontiguousarray(t, dtype=np.float64)
+        else:
+            params = np.fromiter(t, dtype=np.float64)
+        cdef Py_ssize_t i, count = params.shape[0]
+        result = np.empty((count, 3), dtype=np.float64)
+        cdef double[:, ::1] out = result
+        for i in range(count):
+            u = params[i]
+            if isclose(u, max_t, REL_TOL, ABS_TOL):
+                u = max_t
+            if span < 0 or not (knots[span] <= u < knots[span + 1]):
+                span = basis.find_span(u)
+            self._eval(u, span, &out[i, 0])
+        return result
 
     cpdef list derivative(self, double u, int n = 1):
         """ Return point and derivatives up to n <= degree for parameter u. """
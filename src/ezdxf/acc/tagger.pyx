@@ -0,0 +1,157 @@
+# cython: language_level=3
+# Copyright (c) 2024, Manfred Moitzi
+# License: MIT License
+from typing import Iterator, Optional
+from sys import intern
+from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.lldxf.types import (
+    DXFTag,
+    DXFVertex,
+    DXFBinaryTag,
+    POINT_CODES,
+    TYPE_TABLE,
+    BINARY_DATA,
+)
+
+__all__ = ["binary_tags", "compiled_binary_tags"]
+
+
+cdef inline bint is_space(unsigned char c):
+    return c == 32 or c == 9 or c == 13  # " ", "\t", "\r"
+
+
+cdef int parse_group_code(bytes s) except? -1:
+    # Inlined ASCII integer parser, leading and trailing whitespace is allowed
+    # like for int(), e.g. b"  0\r"
+    cdef const unsigned char *c = s
+    cdef Py_ssize_t length = len(s)
+    cdef Py_ssize_t i = 0
+    cdef int sign = 1
+    cdef int value = 0
+    cdef bint has_digits = False
+
+    while i < length and is_space(c[i]):
+        i += 1
+    if i < length and (c[i] == 45 or c[i] == 43):  # "-", "+"
+        if c[i] == 45:
+            sign = -1
+        i += 1
+    while i < length and 48 <= c[i] <= 57 and value < 100_000:
+        value = value * 10 + (c[i] - 48)
+        has_digits = True
+        i += 1
+    while i < length and is_space(c[i]):
+        i += 1
+    if i != length or not has_digits:
+        raise DXFStructureError("Invalid group code")
+    return sign * value
+
+
+def binary_tags(
+    lines: Iterator[bytes],
+    encoding: Optional[str] = None,
+    errors: str = "surrogateescape",
+) -> Iterator[DXFTag]:
+    """Cython implementation of :func:`ezdxf.addons.iterdxf._binary_tags`."""
+    cdef int group_code
+    cdef bytes value
+    for code in lines:
+        group_code = parse_group_code(code)
+        value = next(lines, b"").rstrip(b"\r")
+        if encoding is None:
+            yield DXFTag(group_code, value)
+        elif group_code == 0:
+            yield DXFTag(group_code, intern(value.decode(encoding, errors)))
+        else:
+            yield DXFTag(group_code, value.decode(encoding, errors))
+    raise DXFStructureError("Unexpected end of DXF stream.")
+
+
+def compiled_binary_tags(
+    lines: Iterator[bytes],
+    str encoding,
+    str errors = "surrogateescape",
+) -> Iterator[DXFTag]:
+    """Cython implementation of
+    :func:`ezdxf.addons.iterdxf._compiled_binary_tags`.
+    """
+    cdef int code
+    cdef bint pending = False
+    cdef bytes code_line, value_line
+    cdef tuple y_pair, z_pair
+    cdef tuple point
+    cdef str text
+    cdef list cast_table = CAST_TABLE
+
+    # exactly two lines are consumed for each (code, value) pair
+    pairs = zip(lines, lines)
+    while True:
+        if pending:  # the tag following a 2D point was already consumed
+            pending = False
+        else:
+            pair = next(pairs, None)
+            if pair is None:
+                break
+            code_line, value_line = pair
+        code = parse_group_code(code_line)
+        if code == 0:
+            text = value_line.rstrip(b"\r").decode(encoding, errors)
+            yield DXFTag(0, intern(text.strip()))
+        elif code in POINT_CODES:
+            y_pair = next(pairs, None)
+            z_pair = next(pairs, None)
+            if y_pair is None or z_pair is None:
+                raise DXFStructureError("Unexpected end of DXF stream.")
+            # y-axis is mandatory, like 20 for base x-code 10
+            if parse_group_code(y_pair[0]) != code + 10:
+                raise DXFStructureError("Missing required y coordinate.")
+            try:
+                # z-axis like (30, 0.0) for base x-code 10
+                if parse_group_code(z_pair[0]) == code + 20:
+                    point = (float(value_line), float(y_pair[1]), float(z_pair[1]))
+                else:
+                    point = (float(value_line), float(y_pair[1]))
+                    code_line, value_line = z_pair
+                    pending = True
+            except ValueError:
+                raise DXFStructureError("Invalid floating point values.")
+            yield DXFVertex(code, point)
+        else:
+            if 0 <= code < MAX_GROUP_CODE:
+                type_ = cast_table[code]
+            else:
+                type_ = str
+            if type_ is str:
+                text = value_line.rstrip(b"\r").decode(encoding, errors)
+                if code in BINARY_DATA:
+                    try:
+                        tag = DXFBinaryTag.from_string(code, text)
+                    except ValueError:
+                        raise DXFStructureError("Invalid binary data.")
+                    yield tag
+                else:
+                    yield DXFTag(code, text)
+            else:
+                try:
+                    number = type_(value_line)
+                except ValueError:
+                    # ProE stores int values as floats :((
+                    if type_ is not int:
+                        raise _invalid_tag_error(code, value_line)
+                    try:
+                        number = int(float(value_line))
+                    except ValueError:
+                        raise _invalid_tag_error(code, value_line)
+                yield DXFTag(code, number)
+    raise DXFStructureError("Unexpected end of DXF stream.")
+
+
+cdef int MAX_GROUP_CODE = 1072
+# list index lookup of the cast type of a group code instead of a dict.get()
+# call:
+cdef list CAST_TABLE = [TYPE_TABLE.get(code, str) for code in range(MAX_GROUP_CODE)]
+
+
+def _invalid_tag_error(int code, bytes value) -> DXFStructureError:
+    text = value.strip().decode("ascii", errors="replace")
+    return DXFStructureError(f'Invalid tag (code={code}, value="{text}").')
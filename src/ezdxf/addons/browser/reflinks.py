@@ -112,6 +112,12 @@ reference_guids = {
 }
 
 
+# precomputed reference links:
+_reference_links = {
+    name: link_tpl.format(guid=guid) for name, guid in reference_guids.items()
+}
+_main_index_link = link_tpl.format(guid=main_index_guid)
+
+
 def get_reference_link(name: str) -> str:
-    guid = reference_guids.get(name, main_index_guid)
-    return link_tpl.format(guid=guid)
+    return _reference_links.get(name, _main_index_link)
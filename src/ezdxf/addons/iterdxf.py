@@ -1,6 +1,8 @@
 # Copyright (c) 2020-2022, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
+import os
+import sys
 from typing import (
     Iterable,
     Iterator,
@@ -9,57 +11,75 @@ from typing import (
     Optional,
     Union,
     Any,
+    Callable,
 )
-from io import StringIO
+from io import TextIOWrapper
 from pathlib import Path
+from ezdxf import options
 from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.lldxf.extendedtags import ExtendedTags, DXFTag
+from ezdxf.lldxf.types import (
+    DXFVertex,
+    DXFBinaryTag,
+    POINT_CODES,
+    TYPE_TABLE,
+    BINARY_DATA,
+)
 from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.lldxf.tagger import tag_compiler, ascii_tags_loader
 from ezdxf.filemanagement import dxf_file_info
 from ezdxf.lldxf import fileindex
 
-from ezdxf.entities import DXFGraphic, DXFEntity, Polyline, Insert
+from ezdxf.entities import DXFGraphic, DXFEntity
 from ezdxf.entities import factory
 from ezdxf.entities.subentity import entity_linker
 from ezdxf.tools.codepage import toencoding
 
 __all__ = ["opendxf", "single_pass_modelspace", "modelspace"]
 
-SUPPORTED_TYPES = {
-    "ARC",
-    "LINE",
-    "CIRCLE",
-    "ELLIPSE",
-    "POINT",
-    "LWPOLYLINE",
-    "SPLINE",
-    "3DFACE",
-    "SOLID",
-    "TRACE",
-    "SHAPE",
-    "POLYLINE",
-    "VERTEX",
-    "SEQEND",
-    "MESH",
-    "TEXT",
-    "MTEXT",
-    "HATCH",
-    "INSERT",
-    "ATTRIB",
-    "ATTDEF",
-    "RAY",
-    "XLINE",
-    "DIMENSION",
-    "LEADER",
-    "IMAGE",
-    "WIPEOUT",
-    "HELIX",
-    "MLINE",
-    "MLEADER",
-}
+SUPPORTED_TYPES = frozenset(
+    [
+        "ARC",
+        "LINE",
+        "CIRCLE",
+        "ELLIPSE",
+        "POINT",
+        "LWPOLYLINE",
+        "SPLINE",
+        "3DFACE",
+        "SOLID",
+        "TRACE",
+        "SHAPE",
+        "POLYLINE",
+        "VERTEX",
+        "SEQEND",
+        "MESH",
+        "TEXT",
+        "MTEXT",
+        "HATCH",
+        "INSERT",
+        "ATTRIB",
+        "ATTDEF",
+        "RAY",
+        "XLINE",
+        "DIMENSION",
+        "LEADER",
+        "IMAGE",
+        "WIPEOUT",
+        "HELIX",
+        "MLINE",
+        "MLEADER",
+    ]
+)
 
 Filename = Union[Path, str]
+# Entities are small chunks of data, a big read buffer reduces the count of
+# system calls for reading the entities of the source file:
+READ_BUFFER_SIZE = 65536
+# The export file keeps a single write buffer for all exported entities:
+WRITE_BUFFER_SIZE = 65536
+# Chunk size for reading not seekable binary streams:
+READ_CHUNK_SIZE = 1 << 20
 
 
 class IterDXF:
@@ -82,7 +102,7 @@ class IterDXF:
     def __init__(self, name: Filename, errors: str = "surrogateescape"):
         self.structure, self.sections = self._load_index(str(name))
         self.errors = errors
-        self.file: BinaryIO = open(name, mode="rb")
+        self.file: BinaryIO = open(name, mode="rb", buffering=READ_BUFFER_SIZE)
         if "ENTITIES" not in self.sections:
             raise DXFStructureError("ENTITIES section not found.")
         if self.structure.version > "AC1009" and "OBJECTS" not in self.sections:
@@ -125,9 +145,7 @@ class IterDXF:
         # Copy everything from start of source DXF until the first entity
         # of the ENTITIES section to the new DXF.
         location = self.structure.index[self.sections["ENTITIES"] + 1].location
-        self.file.seek(0)
-        data = self.file.read(location)
-        doc.write_data(data)
+        _copy_data(self.file, 0, location, doc.file)
         return doc
 
     def copy_objects_section(self, f: BinaryIO) -> None:
@@ -140,9 +158,7 @@ class IterDXF:
         start_location = self.structure.index[start_index].location
         end_location = self.structure.index[end_index + 1].location
         count = end_location - start_location
-        self.file.seek(start_location)
-        data = self.file.read(count)
-        f.write(data)
+        _copy_data(self.file, start_location, count, f)
 
     def modelspace(
         self, types: Optional[Iterable[str]] = None
@@ -163,40 +179,52 @@ class IterDXF:
                 returned, ``None`` returns all supported types.
 
         """
-        linked_entity = entity_linker()
-        queued = None
         requested_types = _requested_types(types)
-        for entity in self.load_entities(
-            self.sections["ENTITIES"] + 1, requested_types
-        ):
-            if not linked_entity(entity) and entity.dxf.paperspace == 0:
-                # queue one entity for collecting linked entities:
-                # VERTEX, ATTRIB
-                if queued:
-                    yield queued
-                queued = entity
-        if queued:
-            yield queued
+        return _load_modelspace_entities(
+            self._load_xtags(self.sections["ENTITIES"] + 1, requested_types)
+        )
 
     def load_entities(
-        self, start: int, requested_types: set[str]
+        self, start: int, requested_types: frozenset[str]
     ) -> Iterable[DXFGraphic]:
-        def to_str(data: bytes) -> str:
-            return data.decode(self.encoding, errors=self.errors).replace(
-                "\r\n", "\n"
-            )
+        load_entity = factory.load
+        for xtags in self._load_xtags(start, requested_types):
+            yield load_entity(xtags)  # type: ignore
 
+    def _load_xtags(
+        self, start: int, requested_types: frozenset[str]
+    ) -> Iterator[ExtendedTags]:
+        encoding = self.encoding
+        errors = self.errors
+
+        def to_str(data: bytes) -> str:
+            text = data.decode(encoding, errors=errors)
+            # The byte locations of the file index do not work with a text
+            # stream, searching the raw bytes for CR is faster than creating
+            # a translated copy of each entity with LF line endings:
+            if b"\r" in data:
+                return text.replace("\r\n", "\n")
+            return text
+
+        # bind frequently used callables to local names:
+        read = self.file.read
+        seek = self.file.seek
+        file_index = self.structure.index
         index = start
-        entry = self.structure.index[index]
-        self.file.seek(entry.location)
+        entry = file_index[index]
+        seek(entry.location)
+        skip = 0
         while entry.value != "ENDSEC":
             index += 1
-            next_entry = self.structure.index[index]
+            next_entry = file_index[index]
             size = next_entry.location - entry.location
-            data = self.file.read(size)
             if entry.value in requested_types:
-                xtags = ExtendedTags.from_text(to_str(data))
-                yield factory.load(xtags)  # type: ignore
+                if skip:  # skip a run of unwanted entities by a single seek
+                    seek(skip, 1)
+                    skip = 0
+                yield ExtendedTags.from_text(to_str(read(size)))
+            else:  # skip unwanted entities without copying the data
+                skip += size
             entry = next_entry
 
     def close(self):
@@ -207,12 +235,17 @@ class IterDXF:
 class IterDXFWriter:
     def __init__(self, name: Filename, loader: IterDXF):
         self.name = str(name)
-        self.file: BinaryIO = open(name, mode="wb")
-        self.text = StringIO()
+        self.file: BinaryIO = open(name, mode="wb", buffering=WRITE_BUFFER_SIZE)
+        # The text layer encodes the DXF tags directly into the buffer of the
+        # export file, no temporary string and bytes objects for each entity:
+        self.text = TextIOWrapper(
+            self.file, encoding=loader.encoding, newline=""  # type: ignore
+        )
         self.entity_writer = TagWriter(self.text, loader.dxfversion)
         self.loader = loader
 
     def write_data(self, data: bytes):
+        self.text.flush()
         self.file.write(data)
 
     def write(self, entity: DXFGraphic):
@@ -231,38 +264,54 @@ class IterDXFWriter:
         # entity.appdata = None
         # entity.extension_dict = None
         # entity.reactors = None
-        # reset text stream
-        self.text.seek(0)
-        self.text.truncate()
-
         if entity.dxf.handle is None:  # DXF R12 without handles
             self.entity_writer.write_handles = False
 
+        # exports also the linked sub-entities of POLYLINE and INSERT:
+        # VERTEX, ATTRIB and SEQEND
         entity.export_dxf(self.entity_writer)
-        if entity.dxftype() == "POLYLINE":
-            polyline = cast(Polyline, entity)
-            for vertex in polyline.vertices:
-                vertex.export_dxf(self.entity_writer)
-            polyline.seqend.export_dxf(self.entity_writer)  # type: ignore
-        elif entity.dxftype() == "INSERT":
-            insert = cast(Insert, entity)
-            if insert.attribs_follow:
-                for attrib in insert.attribs:
-                    attrib.export_dxf(self.entity_writer)
-                insert.seqend.export_dxf(self.entity_writer)  # type: ignore
-        data = self.text.getvalue().encode(self.loader.encoding)
-        self.file.write(data)
 
     def close(self):
         """Safe closing of exported DXF file. Copying of OBJECTS section
         happens only at closing the file, without closing the new DXF file is
         invalid.
         """
+        self.text.flush()
         self.file.write(b"  0\r\nENDSEC\r\n")  # for ENTITIES section
         if self.loader.dxfversion > "AC1009":
             self.loader.copy_objects_section(self.file)
         self.file.write(b"  0\r\nEOF\r\n")
-        self.file.close()
+        self.text.close()  # closes also the export file
+
+
+def _copy_data(source: BinaryIO, start: int, count: int, target: BinaryIO) -> None:
+    """Copy `count` bytes from location `start` of the `source` file to the
+    current location of the `target` file without loading the whole data
+    block into memory.
+    """
+    location = start
+    end = start + count
+    if hasattr(os, "sendfile"):
+        try:
+            in_fd = source.fileno()
+            out_fd = target.fileno()
+            target.flush()
+            # copy the data inside the kernel without a userspace buffer
+            while location < end:
+                sent = os.sendfile(out_fd, in_fd, location, end - location)
+                if sent == 0:  # end of source file
+                    break
+                location += sent
+            return
+        except OSError:  # e.g. the target has to be a socket on macOS
+            pass
+    source.seek(location)
+    while location < end:
+        data = source.read(min(READ_CHUNK_SIZE, end - location))
+        if not data:
+            break
+        target.write(data)
+        location += len(data)
 
 
 def opendxf(filename: Filename, errors: str = "surrogateescape") -> IterDXF:
@@ -314,46 +363,36 @@ def modelspace(
 
     """
     info = dxf_file_info(str(filename))
-    prev_code: int = -1
-    prev_value: Any = ""
-    entities = False
     requested_types = _requested_types(types)
 
     with open(filename, mode="rt", encoding=info.encoding, errors=errors) as fp:
         tagger = ascii_tags_loader(fp)
-        queued: Optional[DXFEntity] = None
-        tags: list[DXFTag] = []
-        linked_entity = entity_linker()
 
-        for tag in tag_compiler(tagger):
-            code = tag.code
-            value = tag.value
-            if entities:
-                if code == 0:
-                    if len(tags) and tags[0].value in requested_types:
-                        entity = factory.load(ExtendedTags(tags))
-                        if (
-                            not linked_entity(entity)
-                            and entity.dxf.paperspace == 0
-                        ):
-                            # queue one entity for collecting linked entities:
-                            # VERTEX, ATTRIB
-                            if queued:
-                                yield queued  # type: ignore
-                            queued = entity
-                    tags = [tag]
-                else:
-                    tags.append(tag)
-                if code == 0 and value == "ENDSEC":
-                    if queued:
-                        yield queued  # type: ignore
-                    return
-                continue  # if entities - nothing else matters
-            elif code == 2 and prev_code == 0 and prev_value == "SECTION":
-                entities = value == "ENTITIES"
-
-            prev_code = code
-            prev_value = value
+        def load_xtags() -> Iterator[ExtendedTags]:
+            prev_code: int = -1
+            prev_value: Any = ""
+            entities = False
+            tags: list[DXFTag] = []
+            for tag in tag_compiler(tagger):
+                code = tag.code
+                value = tag.value
+                if entities:
+                    if code == 0:
+                        if len(tags) and tags[0].value in requested_types:
+                            yield ExtendedTags(tags)
+                        tags = [tag]
+                    else:
+                        tags.append(tag)
+                    if code == 0 and value == "ENDSEC":
+                        return
+                    continue  # if entities - nothing else matters
+                elif code == 2 and prev_code == 0 and prev_value == "SECTION":
+                    entities = value == "ENTITIES"
+
+                prev_code = code
+                prev_value = value
+
+        yield from _load_modelspace_entities(load_xtags())
 
 
 def single_pass_modelspace(
@@ -387,11 +426,12 @@ def single_pass_modelspace(
     encoding = "cp1252"
     version = "AC1009"
     prev_code: int = -1
-    prev_value: str = ""
     entities = False
     requested_types = _requested_types(types)
 
-    for code, value in binary_tagger(stream):
+    binary_tags, compiled_binary_tags = _binary_tag_loaders()
+    lines = _binary_lines(stream)
+    for code, value in binary_tags(lines):
         if code == 0 and value == b"ENDSEC":
             break
         elif code == 2 and prev_code == 0 and value != b"HEADER":
@@ -414,36 +454,46 @@ def single_pass_modelspace(
     if version >= "AC1021":
         encoding = "utf-8"
 
-    queued: Optional[DXFGraphic] = None
-    tags: list[DXFTag] = []
-    linked_entity = entity_linker()
+    dxftags = compiled_binary_tags(lines, encoding, errors)
+    if not entities:
+        # search the ENTITIES section: (0, SECTION), (2, ENTITIES)
+        prev_code = -1
+        prev_value: Any = ""
+        for tag in dxftags:
+            code = tag.code
+            value = tag.value
+            if code == 2 and prev_code == 0 and prev_value == "SECTION":
+                if value == "ENTITIES":
+                    break
+            prev_code = code
+            prev_value = value
 
-    for tag in tag_compiler(binary_tagger(stream, encoding, errors)):
-        code = tag.code
-        value = tag.value
-        if entities:
-            if code == 0 and value == "ENDSEC":
-                if queued:
-                    yield queued
-                return
-            if code == 0:
+    def load_xtags() -> Iterator[ExtendedTags]:
+        # process the ENTITIES section, without tracking the previous tag
+        tags: list[DXFTag] = []
+        for tag in dxftags:
+            if tag.code == 0:
+                if tag.value == "ENDSEC":
+                    break
                 if len(tags) and tags[0].value in requested_types:
-                    entity = cast(DXFGraphic, factory.load(ExtendedTags(tags)))
-                    if not linked_entity(entity) and entity.dxf.paperspace == 0:
-                        # queue one entity for collecting linked entities:
-                        # VERTEX, ATTRIB
-                        if queued:
-                            yield queued
-                        queued = entity
+                    yield ExtendedTags(tags)
                 tags = [tag]
             else:
                 tags.append(tag)
-            continue  # if entities - nothing else matters
-        elif code == 2 and prev_code == 0 and prev_value == "SECTION":
-            entities = value == "ENTITIES"
 
-        prev_code = code
-        prev_value = value
+    yield from _load_modelspace_entities(load_xtags())
+
+
+def _binary_tag_loaders() -> tuple[Callable, Callable]:
+    """Returns the binary tag loaders of the C-extension if available."""
+    if options.use_c_ext:
+        try:
+            from ezdxf.acc import tagger  # type: ignore
+        except ImportError:
+            pass
+        else:
+            return tagger.binary_tags, tagger.compiled_binary_tags
+    return _binary_tags, _compiled_binary_tags
 
 
 def binary_tagger(
@@ -451,30 +501,229 @@ def binary_tagger(
     encoding: Optional[str] = None,
     errors: str = "surrogateescape",
 ) -> Iterator[DXFTag]:
+    return _binary_tags(_binary_lines(file), encoding, errors)
+
+
+def _binary_lines(file: BinaryIO) -> Iterator[bytes]:
+    """Yields the lines of a binary stream without the line feed, the stream
+    is read in big chunks and split into lines by the C-level bytes.split()
+    method, which is much faster than calling readline() for each line.
+    """
+    read = file.read
+    rest = b""
     while True:
+        chunk = read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        lines = (rest + chunk).split(b"\n")
+        # the last line is incomplete or an empty string:
+        rest = lines.pop()
+        yield from lines
+    if rest:  # last line without line ending
+        yield rest
+
+
+def _binary_tags(
+    lines: Iterator[bytes],
+    encoding: Optional[str] = None,
+    errors: str = "surrogateescape",
+) -> Iterator[DXFTag]:
+    # Consumes exactly two lines for each yielded tag, the lines iterator can
+    # be shared by consecutive tag iterators.
+    _DXFTag = DXFTag
+    _intern = sys.intern
+    for code in lines:
         try:
+            group_code = int(code)
+        except ValueError:
+            raise DXFStructureError(f"Invalid group code")
+        value = next(lines, b"").rstrip(b"\r")
+        if encoding:
+            text = value.decode(encoding, errors=errors)
+            if group_code == 0:
+                # The structure tags have a tiny vocabulary, interned strings
+                # are compared by identity, e.g. ENDSEC, SEQEND and DXF types
+                text = _intern(text)
+            yield _DXFTag(group_code, text)
+        else:
+            yield _DXFTag(group_code, value)
+    raise DXFStructureError("Unexpected end of DXF stream.")
+
+
+def _compiled_binary_tags(
+    lines: Iterator[bytes],
+    encoding: str,
+    errors: str = "surrogateescape",
+) -> Iterator[DXFTag]:
+    """Yields the same compiled DXF tags as
+    ``tag_compiler(_binary_tags(lines, encoding, errors))`` but in a single
+    generator, numeric values are converted directly from the binary data
+    without decoding.
+    """
+    _DXFTag = DXFTag
+    _DXFVertex = DXFVertex
+    _intern = sys.intern
+    cast_table = _CAST_TABLE
+    # (code, value) pairs are consumed by zip() without a Python frame for each
+    # tag, exactly two lines are consumed for each pair:
+    pairs = zip(lines, lines)
+    for code_line, value_line in pairs:
+        # The loop is repeated only for the tag following a 2D point, which
+        # was already consumed to check the z-axis.
+        while True:
             try:
-                code = int(file.readline())
+                code = int(code_line)
             except ValueError:
-                raise DXFStructureError(f"Invalid group code")
-            value = file.readline().rstrip(b"\r\n")
-            yield DXFTag(
-                code,
-                value.decode(encoding, errors=errors) if encoding else value,
-            )
-        except IOError:
-            return
+                raise DXFStructureError("Invalid group code")
+            if code == 0:
+                text = value_line.rstrip(b"\r").decode(encoding, errors=errors)
+                yield _DXFTag(0, _intern(text.strip()))
+            elif code in POINT_CODES:
+                y_pair = next(pairs, None)
+                z_pair = next(pairs, None)
+                if y_pair is None or z_pair is None:
+                    raise DXFStructureError("Unexpected end of DXF stream.")
+                try:
+                    # y-axis is mandatory, like 20 for base x-code 10
+                    if int(y_pair[0]) != code + 10:
+                        raise DXFStructureError("Missing required y coordinate.")
+                    x = float(value_line)
+                    y = float(y_pair[1])
+                    # z-axis like (30, 0.0) for base x-code 10
+                    if int(z_pair[0]) == code + 20:
+                        point: tuple[float, ...] = (x, y, float(z_pair[1]))
+                    else:
+                        point = (x, y)
+                except ValueError:
+                    raise DXFStructureError("Invalid floating point values.")
+                yield _DXFVertex(code, point)
+                if len(point) == 2:
+                    code_line, value_line = z_pair
+                    continue
+            else:
+                try:
+                    type_ = cast_table[code]
+                except IndexError:
+                    type_ = str
+                if type_ is str:
+                    text = value_line.rstrip(b"\r").decode(encoding, errors=errors)
+                    if code in BINARY_DATA:
+                        try:
+                            yield DXFBinaryTag.from_string(code, text)
+                        except ValueError:
+                            raise DXFStructureError("Invalid binary data.")
+                    else:
+                        yield _DXFTag(code, text)
+                else:
+                    try:
+                        number = type_(value_line)
+                    except ValueError:
+                        # ProE stores int values as floats :((
+                        if type_ is not int:
+                            raise _invalid_tag_error(code, value_line)
+                        try:
+                            number = int(float(value_line))
+                        except ValueError:
+                            raise _invalid_tag_error(code, value_line)
+                    yield _DXFTag(code, number)
+            break
+    raise DXFStructureError("Unexpected end of DXF stream.")
+
+
+def _build_cast_table() -> list[type]:
+    # Group codes are in the range [0, 1071], the table is extended by a
+    # second half of str types, negative group codes (internal use only) are
+    # wrapped around to this second half.
+    size = 1072
+    return [TYPE_TABLE.get(code, str) for code in range(size)] + [str] * size
+
+
+# list index lookup of the cast type of a group code instead of a dict.get()
+# call:
+_CAST_TABLE = _build_cast_table()
+
+
+def _invalid_tag_error(code: int, value: bytes) -> DXFStructureError:
+    text = value.strip().decode("ascii", errors="replace")
+    return DXFStructureError(f'Invalid tag (code={code}, value="{text}").')
 
 
-def _requested_types(types: Optional[Iterable[str]]) -> set[str]:
+def _load_modelspace_entities(
+    xtags_loader: Iterable[ExtendedTags],
+) -> Iterator[DXFGraphic]:
+    """Yields the modelspace entities and links the sub-entities VERTEX, ATTRIB
+    and SEQEND to their parent entity.
+
+    Paperspace entities are skipped before loading the DXF entity, this
+    includes the linked sub-entities of skipped POLYLINE and INSERT entities.
+    """
+    linked_entity = entity_linker()
+    load_entity = factory.load
+    queued: Optional[DXFGraphic] = None
+    skip_sub_entities = False
+    for xtags in xtags_loader:
+        dxftype = xtags.dxftype()
+        if skip_sub_entities:
+            if dxftype in _LINKED_SUB_ENTITIES:
+                continue
+            skip_sub_entities = False
+            if dxftype == "SEQEND":
+                continue
+        if dxftype not in _SUB_ENTITIES and not _is_modelspace_entity(xtags):
+            # The paperspace flag of sub-entities is ignored by the linker,
+            # they are always loaded.
+            skip_sub_entities = _has_linked_sub_entities(dxftype, xtags)
+            continue
+        entity = cast(DXFGraphic, load_entity(xtags))
+        if not linked_entity(entity) and _is_modelspace_entity(xtags):
+            # queue one entity for collecting linked entities:
+            # VERTEX, ATTRIB
+            if queued:
+                yield queued
+            queued = entity
+    if queued:
+        yield queued
+
+
+_LINKED_SUB_ENTITIES = frozenset(["VERTEX", "ATTRIB"])
+_SUB_ENTITIES = frozenset(["VERTEX", "ATTRIB", "SEQEND"])
+
+
+def _has_linked_sub_entities(dxftype: str, xtags: ExtendedTags) -> bool:
+    if dxftype == "POLYLINE":
+        return True
+    if dxftype == "INSERT":  # attribs follow flag (66, 1)
+        return any(
+            tag.code == 66 and tag.value == 1
+            for subclass in xtags.subclasses
+            for tag in subclass
+        )
+    return False
+
+
+def _is_modelspace_entity(xtags: ExtendedTags) -> bool:
+    """Returns ``True`` if the paperspace flag (67, 1) is not set, reads the
+    group code 67 directly from the tags without accessing the DXF namespace
+    of the loaded entity.
+    """
+    # DXF R12: all tags are stored in the first subclass without a marker
+    # DXF R2000+: the paperspace flag is stored in the AcDbEntity subclass
+    for subclass in xtags.subclasses[:2]:
+        for tag in subclass:
+            if tag.code == 67:
+                return tag.value == 0
+    return True
+
+
+def _requested_types(types: Optional[Iterable[str]]) -> frozenset[str]:
     if types:
-        requested = SUPPORTED_TYPES.intersection(set(types))
+        requested = set(SUPPORTED_TYPES.intersection(types))
         if "POLYLINE" in requested:
             requested.add("SEQEND")
             requested.add("VERTEX")
         if "INSERT" in requested:
             requested.add("SEQEND")
             requested.add("ATTRIB")
-    else:
-        requested = SUPPORTED_TYPES
-    return requested
+        return frozenset(requested)
+    return SUPPORTED_TYPES
+
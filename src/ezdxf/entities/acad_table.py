@@ -349,6 +349,8 @@ class TableStyle(DXFObject):
 
 
 class TableStyleManager(ObjectCollection[TableStyle]):
+    __slots__ = ()
+
     def __init__(self, doc: Drawing):
         super().__init__(doc, dict_name="ACAD_TABLESTYLE", object_type="TABLESTYLE")
 
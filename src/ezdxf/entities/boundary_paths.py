@@ -673,22 +673,20 @@ class PolylinePath(AbstractBoundaryPath):
 
     def transform(self, ocs: OCSTransform, elevation: float) -> None:
         """Transform polyline path."""
-        has_non_uniform_scaling = not ocs.scale_uniform
-
-        def _transform():
-            for x, y, bulge in self.vertices:
-                # PolylinePaths() with arcs should be converted to
-                # EdgePath(in BoundaryPath.transform()).
-                if bulge and has_non_uniform_scaling:
-                    raise NonUniformScalingError(
-                        "Polyline path with arcs does not support non-uniform "
-                        "scaling"
-                    )
-                v = ocs.transform_vertex(Vec3(x, y, elevation))
-                yield v.x, v.y, bulge
-
-        if self.vertices:
-            self.vertices = list(_transform())
+        if not self.vertices:
+            return
+        if not ocs.scale_uniform and any(bulge for _, _, bulge in self.vertices):
+            # PolylinePaths() with arcs should be converted to
+            # EdgePath(in BoundaryPath.transform()).
+            raise NonUniformScalingError(
+                "Polyline path with arcs does not support non-uniform scaling"
+            )
+        vertices = ocs.transform_vertices(
+            Vec3(x, y, elevation) for x, y, _ in self.vertices
+        )
+        self.vertices = [
+            (v.x, v.y, bulge) for v, (_, _, bulge) in zip(vertices, self.vertices)
+        ]
 
 
 class EdgePath(AbstractBoundaryPath):
@@ -330,6 +330,8 @@ def valid_layout_handles(layouts: Layouts) -> set[str]:
 
 
 class GroupCollection(ObjectCollection[DXFGroup]):
+    __slots__ = ("_next_unnamed_number",)
+
     def __init__(self, doc: Drawing):
         super().__init__(doc, dict_name="ACAD_GROUP", object_type="GROUP")
         self._next_unnamed_number = 0
@@ -381,6 +383,47 @@ class GroupCollection(ObjectCollection[DXFGroup]):
         }
         return cast(DXFGroup, self._new(name, dxfattribs))
 
+    def new_many(
+        self,
+        names: Iterable[Optional[str]],
+        description: str = "",
+        selectable: bool = True,
+    ) -> list[DXFGroup]:
+        r"""Creates a new group for each name in `names`. A name ``None``
+        creates an unnamed group like :meth:`new`. All names are checked
+        before the first group is created.
+
+        Args:
+            names: iterable of group names as strings or ``None``
+            description: group description as string for all groups
+            selectable: groups are selectable if ``True``
+
+        Raises:
+            DXFValueError: if a group name already exist
+
+        """
+        names = list(names)
+        named = [name for name in names if name is not None]
+        self._check_unique_names(named)
+        reserved = set(validator.make_table_key(name) for name in named)
+
+        entries: list[tuple[str, dict]] = []
+        for name in names:
+            if name is None:
+                name = self.next_name()
+                while validator.make_table_key(name) in reserved:
+                    name = self.next_name()
+                unnamed = 1
+            else:
+                unnamed = 0
+            dxfattribs = {
+                "description": description,
+                "unnamed": unnamed,
+                "selectable": int(bool(selectable)),
+            }
+            entries.append((name, dxfattribs))
+        return cast(list[DXFGroup], self._new_many(entries))
+
     def delete(self, group: Union[DXFGroup, str]) -> None:
         """Delete `group`, `group` can be an object of type :class:`DXFGroup`
         or a group name as string.
@@ -372,7 +372,7 @@ class LWPolyline(DXFGraphic):
             )
             # The caller function has to catch this exception and explode the
             # LWPOLYLINE into LINE and ELLIPSE entities.
-        vertices = list(ocs.transform_vertex(v) for v in self.vertices_in_ocs())
+        vertices = list(ocs.transform_vertices(self.vertices_in_ocs()))
         lwpoints = []
         for v, p in zip(vertices, self.lwpoints):
             _, _, start_width, end_width, bulge = p
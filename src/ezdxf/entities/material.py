@@ -421,6 +421,8 @@ class Material(DXFObject):
 
 
 class MaterialCollection(ObjectCollection[Material]):
+    __slots__ = ()
+
     def __init__(self, doc: Drawing):
         super().__init__(doc, dict_name="ACAD_MATERIAL", object_type="MATERIAL")
         self.create_required_entries()
@@ -1449,6 +1449,8 @@ class MLeaderStyle(DXFObject):
 
 
 class MLeaderStyleCollection(ObjectCollection[MLeaderStyle]):
+    __slots__ = ()
+
     def __init__(self, doc: Drawing):
         super().__init__(doc, dict_name="ACAD_MLEADERSTYLE", object_type="MLEADERSTYLE")
         self.create_required_entries()
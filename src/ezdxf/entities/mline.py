@@ -956,6 +956,8 @@ class MLineStyle(DXFObject):
 
 
 class MLineStyleCollection(ObjectCollection[MLineStyle]):
+    __slots__ = ()
+
     def __init__(self, doc: Drawing):
         super().__init__(doc, dict_name="ACAD_MLINESTYLE", object_type="MLINESTYLE")
         self.create_required_entries()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 from typing import (
     TYPE_CHECKING,
+    Iterable,
     Iterator,
     cast,
     Optional,
@@ -43,6 +44,8 @@ class ObjectCollection(Generic[T]):
 
     """
 
+    __slots__ = ("doc", "object_dict_name", "object_type", "object_dict")
+
     def __init__(
         self,
         doc: Drawing,
@@ -67,7 +70,7 @@ class ObjectCollection(Generic[T]):
         return len(self.object_dict)
 
     def __contains__(self, name: str) -> bool:
-        return self.has_entry(name)
+        return self.get(name) is not None
 
     def __getitem__(self, name: str) -> T:
         entry = self.get(name)
@@ -105,8 +108,11 @@ class ObjectCollection(Generic[T]):
             default: default value
 
         """
+        object_dict = self.object_dict
+        if name in object_dict:  # fast path for exact matching names
+            return object_dict[name]  # type: ignore
         name = make_table_key(name)
-        for entry_name, obj in self.object_dict.items():
+        for entry_name, obj in object_dict.items():
             if make_table_key(entry_name) == name:
                 return obj
         return default
@@ -133,6 +139,38 @@ class ObjectCollection(Generic[T]):
             raise DXFValueError(f"{self.object_type} entry {name} already exists.")
         return self._new(name, dxfattribs={"name": name})
 
+    def new_many(self, names: Iterable[str]) -> list[T]:
+        """Create new objects of type `self.object_type` for all `names` and
+        store their handles in the object manager dictionary. All names are
+        checked before the first object is created.
+
+        Args:
+            names: iterable of object names as strings
+
+        Returns:
+            list of new objects of type `self.object_type`
+
+        Raises:
+            DXFValueError: if an object name already exist or is invalid
+
+        (internal API)
+
+        """
+        new_names = [validate_name(name) for name in names]
+        self._check_unique_names(new_names)
+        return self._new_many((name, {"name": name}) for name in new_names)
+
+    def _check_unique_names(self, names: Iterable[str]) -> None:
+        """Raises :class:`DXFValueError` if any name of `names` already exist
+        in the collection or occurs more than once in `names`.
+        """
+        keys = {make_table_key(name) for name in self.object_dict.keys()}
+        for name in names:
+            key = make_table_key(name)
+            if key in keys:
+                raise DXFValueError(f"{self.object_type} entry {name} already exists.")
+            keys.add(key)
+
     def duplicate_entry(self, name: str, new_name: str) -> T:
         """Returns a new table entry `new_name` as copy of `name`,
         replaces entry `new_name` if already exist.
@@ -164,16 +202,24 @@ class ObjectCollection(Generic[T]):
         return new_entry  # type: ignore
 
     def _new(self, name: str, dxfattribs: dict) -> T:
+        return self._new_many([(name, dxfattribs)])[0]
+
+    def _new_many(self, entries: Iterable[tuple[str, dict]]) -> list[T]:
         objects = self.doc.objects
         assert objects is not None
 
-        owner = self.object_dict.dxf.handle
-        dxfattribs["owner"] = owner
-        obj = objects.add_dxf_object_with_reactor(
-            self.object_type, dxfattribs=dxfattribs
-        )
-        self.object_dict.add(name, obj)
-        return cast(T, obj)
+        object_dict = self.object_dict
+        owner = object_dict.dxf.handle
+        object_type = self.object_type
+        new_objects: list[T] = []
+        for name, dxfattribs in entries:
+            dxfattribs["owner"] = owner
+            obj = objects.add_dxf_object_with_reactor(
+                object_type, dxfattribs=dxfattribs
+            )
+            object_dict.add(name, obj)
+            new_objects.append(cast(T, obj))
+        return new_objects
 
     def delete(self, name: str) -> None:
         objects = self.doc.objects
@@ -480,9 +480,7 @@ class Polyline(LinkedEntities):
                 z_axis = dxf.elevation.z
             else:
                 z_axis = None
-            vertices = [
-                ocs.transform_vertex(vertex) for vertex in _ocs_locations(z_axis)
-            ]
+            vertices = list(ocs.transform_vertices(_ocs_locations(z_axis)))
 
             # All vertices of a 2D polyline must have the same z-axis, which is
             # the elevation of the polyline:
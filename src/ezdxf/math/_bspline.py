@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Iterable, Sequence, Optional
 import math
 import bisect
+import numpy as np
 
 # The pure Python implementation can't import from ._ctypes or ezdxf.math!
 from ._vector import Vec3, NULLVEC
@@ -16,7 +17,14 @@ __all__ = ["Basis", "Evaluator"]
 class Basis:
     """Immutable Basis function class."""
 
-    __slots__ = ("_knots", "_weights", "_order", "_count")
+    __slots__ = (
+        "_knots",
+        "_weights",
+        "_order",
+        "_count",
+        "_knot_array",
+        "_bernstein_form",
+    )
 
     def __init__(
         self,
@@ -29,6 +37,9 @@ class Basis:
         self._weights = tuple(weights or [])
         self._order: int = int(order)
         self._count: int = int(count)
+        self._knot_array = np.array(self._knots, dtype=np.float64)
+        # lazy evaluated by bernstein_form():
+        self._bernstein_form: Optional[tuple[np.ndarray, np.ndarray]] = None
 
         # validation checks:
         len_weights = len(self._weights)
@@ -97,24 +108,162 @@ class Basis:
         # Source: The NURBS Book: Algorithm A2.2
         order = self._order
         knots = self._knots
-        N = [0.0] * order
-        left = list(N)
-        right = list(N)
-        N[0] = 1.0
-        for j in range(1, order):
-            left[j] = u - knots[max(0, span + 1 - j)]
-            right[j] = knots[span + j] - u
-            saved = 0.0
-            for r in range(j):
-                temp = N[r] / (right[r + 1] + left[j - r])
-                N[r] = saved + right[r + 1] * temp
-                saved = left[j - r] * temp
-            N[j] = saved
+        if order == 4:
+            N = _cubic_basis_funcs(knots, span, u)
+        elif order == 3:
+            N = _quadratic_basis_funcs(knots, span, u)
+        else:
+            N = _basis_funcs(knots, order, span, u)
         if self.is_rational:
             return self.span_weighting(N, span)
         else:
             return N
 
+    def find_spans(self, u: np.ndarray) -> np.ndarray:
+        """Returns the knot span indices for multiple parameters `u`, same as
+        :meth:`find_span` for each parameter.
+        """
+        knots = self._knot_array
+        count = self._count
+        p = self._order - 1
+        if knots[p] == 0.0:  # same as bisect.bisect_right(knots, u, p, count)
+            spans = np.searchsorted(knots[p:count], u, side="right") + p - 1
+        else:
+            spans = np.minimum(np.searchsorted(knots, u, side="right"), count) - 1
+        spans[u >= knots[count]] = count - 1
+        return spans
+
+    def bernstein_form(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the basis functions in Bernstein-Bézier form for each knot
+        span of the valid parameter range, the result is cached.
+
+        Returns a tuple (valid, coefficients), `valid` is a boolean array which
+        is ``True`` for each knot span index with a Bernstein form.
+        The array `coefficients` has the shape (count, order, order), the
+        item [span, i, k] is the k-th Bernstein coefficient of the i-th
+        non-zero basis function of this knot span.
+
+        """
+        if self._bernstein_form is None:
+            self._bernstein_form = self._build_bernstein_form()
+        return self._bernstein_form
+
+    def _build_bernstein_form(self) -> tuple[np.ndarray, np.ndarray]:
+        # The Bézier control points of a knot span [a, b) are the blossom
+        # values P(a, ..., a, b, ..., b), evaluated by the de Boor algorithm
+        # for the unit vectors as control points.
+        order = self._order
+        count = self._count
+        p = order - 1
+        knots = self._knot_array
+        valid = np.zeros(count, dtype=bool)
+        valid[p:] = knots[p + 1 : count + 1] > knots[p:count]
+        spans = np.flatnonzero(valid)
+        coefficients = np.zeros((count, order, order))
+        a = knots[spans]
+        b = knots[spans + 1]
+        for k in range(order):
+            d = np.broadcast_to(np.eye(order), (len(spans), order, order)).copy()
+            for r in range(1, order):
+                t = a if r <= p - k else b
+                for i in range(p, r - 1, -1):
+                    low = knots[spans - p + i]
+                    alpha = (t - low) / (knots[spans + i + 1 - r] - low)
+                    d[:, i] = (1.0 - alpha)[:, np.newaxis] * d[:, i - 1] + (
+                        alpha[:, np.newaxis] * d[:, i]
+                    )
+            coefficients[spans, :, k] = d[:, p]
+        return valid, coefficients
+
+    def basis_funcs_array(self, spans: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Returns the basis functions for multiple parameters `u` and their
+        knot `spans` as (n, order) array, same as :meth:`basis_funcs` for each
+        parameter.
+        """
+        coefficients = self.bernstein_form()[1]
+        inside = self.bernstein_mask(spans, u)
+        if np.all(inside):
+            N = self._bernstein_basis_funcs(spans, u, coefficients)
+        else:
+            N = np.empty((len(u), self._order))
+            N[inside] = self._bernstein_basis_funcs(
+                spans[inside], u[inside], coefficients
+            )
+            outside = ~inside
+            N[outside] = self._basis_funcs_array(spans[outside], u[outside])
+        if self.is_rational:
+            return self._span_weighting_array(N, spans)
+        return N
+
+    def bernstein_mask(self, spans: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Returns a boolean array which is ``True`` for all parameters `u`
+        which can be evaluated by the Bernstein-Bézier form of their knot
+        `spans`.
+        """
+        knots = self._knot_array
+        valid = self.bernstein_form()[0]
+        inside = (spans >= 0) & (spans < self._count)
+        inside[inside] = valid[spans[inside]]
+        # extrapolation is done by the de Boor algorithm:
+        inside[inside] = (u[inside] >= knots[spans[inside]]) & (
+            u[inside] <= knots[spans[inside] + 1]
+        )
+        return inside
+
+    def _bernstein_basis_funcs(
+        self, spans: np.ndarray, u: np.ndarray, coefficients: np.ndarray
+    ) -> np.ndarray:
+        knots = self._knot_array
+        a = knots[spans]
+        t = (u - a) / (knots[spans + 1] - a)
+        # Source: The NURBS Book: Algorithm A1.3
+        bernstein = np.zeros((len(u), self._order))
+        bernstein[:, 0] = 1.0
+        t1 = 1.0 - t
+        for j in range(1, self._order):
+            saved = np.zeros(len(u))
+            for k in range(j):
+                temp = bernstein[:, k].copy()
+                bernstein[:, k] = saved + t1 * temp
+                saved = t * temp
+            bernstein[:, j] = saved
+        return np.einsum("nik,nk->ni", coefficients[spans], bernstein)
+
+    def _basis_funcs_array(self, spans: np.ndarray, u: np.ndarray) -> np.ndarray:
+        # Source: The NURBS Book: Algorithm A2.2 for multiple parameters
+        order = self._order
+        knots = self._knot_array
+        count = len(u)
+        N = np.zeros((count, order))
+        left = np.zeros((count, order))
+        right = np.zeros((count, order))
+        N[:, 0] = 1.0
+        for j in range(1, order):
+            left[:, j] = u - knots[np.maximum(0, spans + 1 - j)]
+            right[:, j] = knots[spans + j] - u
+            saved = np.zeros(count)
+            for r in range(j):
+                divisor = right[:, r + 1] + left[:, j - r]
+                if not np.all(divisor):
+                    raise ZeroDivisionError("float division by zero")
+                temp = N[:, r] / divisor
+                N[:, r] = saved + right[:, r + 1] * temp
+                saved = left[:, j - r] * temp
+            N[:, j] = saved
+        return N
+
+    def _span_weighting_array(self, N: np.ndarray, spans: np.ndarray) -> np.ndarray:
+        order = self._order
+        weights = np.array(self._weights, dtype=np.float64)
+        products = N * weights[spans[:, np.newaxis] - order + 1 + np.arange(order)]
+        s = products.sum(axis=1)
+        # no weights for knot spans outside the valid parameter range:
+        is_zero = (s == 0.0) | (spans < order - 1)
+        s[is_zero] = 1.0
+        N = products / s[:, np.newaxis]
+        N[is_zero] = 0.0
+        return N
+
     def span_weighting(self, nbasis: list[float], span: int) -> list[float]:
         size = len(nbasis)
         weights = self._weights[span - self._order + 1 : span + 1]
@@ -195,14 +344,117 @@ class Basis:
         return derivatives[: n + 1]
 
 
+def _basis_funcs(
+    knots: Sequence[float], order: int, span: int, u: float
+) -> list[float]:
+    # Source: The NURBS Book: Algorithm A2.2
+    N = [0.0] * order
+    left = list(N)
+    right = list(N)
+    N[0] = 1.0
+    for j in range(1, order):
+        left[j] = u - knots[max(0, span + 1 - j)]
+        right[j] = knots[span + j] - u
+        saved = 0.0
+        for r in range(j):
+            temp = N[r] / (right[r + 1] + left[j - r])
+            N[r] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        N[j] = saved
+    return N
+
+
+# Unrolled Algorithm A2.2 for the most common spline orders, the arithmetic
+# is the same as for _basis_funcs():
+def _quadratic_basis_funcs(knots: Sequence[float], span: int, u: float) -> list[float]:
+    left1 = u - knots[max(0, span)]
+    left2 = u - knots[max(0, span - 1)]
+    right1 = knots[span + 1] - u
+    right2 = knots[span + 2] - u
+    # j = 1
+    temp = 1.0 / (right1 + left1)
+    n0 = right1 * temp
+    n1 = left1 * temp
+    # j = 2
+    temp = n0 / (right1 + left2)
+    n0 = right1 * temp
+    saved = left2 * temp
+    temp = n1 / (right2 + left1)
+    n1 = saved + right2 * temp
+    return [n0, n1, left1 * temp]
+
+
+def _cubic_basis_funcs(knots: Sequence[float], span: int, u: float) -> list[float]:
+    left1 = u - knots[max(0, span)]
+    left2 = u - knots[max(0, span - 1)]
+    left3 = u - knots[max(0, span - 2)]
+    right1 = knots[span + 1] - u
+    right2 = knots[span + 2] - u
+    right3 = knots[span + 3] - u
+    # j = 1
+    temp = 1.0 / (right1 + left1)
+    n0 = right1 * temp
+    n1 = left1 * temp
+    # j = 2
+    temp = n0 / (right1 + left2)
+    n0 = right1 * temp
+    saved = left2 * temp
+    temp = n1 / (right2 + left1)
+    n1 = saved + right2 * temp
+    n2 = left1 * temp
+    # j = 3
+    temp = n0 / (right1 + left3)
+    n0 = right1 * temp
+    saved = left3 * temp
+    temp = n1 / (right2 + left2)
+    n1 = saved + right2 * temp
+    saved = left2 * temp
+    temp = n2 / (right3 + left1)
+    n2 = saved + right3 * temp
+    return [n0, n1, n2, left1 * temp]
+
+
+def bezier_eval_linear(coefficients: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Evaluates Bézier curves in linear time for multiple parameters `t` in
+    the range [0, 1].
+
+    The array `coefficients` has the shape (n, dim, order), the last axis
+    contains the Bernstein coefficients (control points) of the curve to
+    evaluate at parameter t[i]. Returns the (n, dim) array of curve points.
+
+    Source: Woźny, Chudy: "Linear-time geometric algorithm for evaluating
+    Bézier curves", Computer-Aided Design 118 (2020)
+
+    """
+    n = coefficients.shape[-1] - 1
+    t = t[:, np.newaxis]
+    t1 = 1.0 - t
+    h = np.ones_like(t)
+    q = coefficients[..., 0]
+    # a sequence of convex combinations, h is always in the range [0, 1]
+    for k in range(1, n + 1):
+        h = h * t * (n - k + 1)
+        h = h / (k * t1 + h)
+        q = (1.0 - h) * q + h * coefficients[..., k]
+    return q
+
+
 class Evaluator:
     """B-spline curve point and curve derivative evaluator."""
 
-    __slots__ = ["_basis", "_control_points"]
+    __slots__ = [
+        "_basis",
+        "_control_points",
+        "_homogeneous_control_points",
+        "_segments",
+    ]
 
     def __init__(self, basis: Basis, control_points: Sequence[Vec3]):
         self._basis = basis
         self._control_points = control_points
+        # lazy evaluated by points():
+        self._homogeneous_control_points: Optional[np.ndarray] = None
+        self._segments: Optional[np.ndarray] = None
 
     def point(self, u: float) -> Vec3:
         # Source: The NURBS Book: Algorithm A3.1
@@ -219,8 +471,82 @@ class Evaluator:
         )
 
     def points(self, t: Iterable[float]) -> Iterable[Vec3]:
-        for u in t:
-            yield self.point(u)
+        return Vec3.generate(self.points_array(t).tolist())
+
+    def points_array(self, t: Iterable[float]) -> np.ndarray:
+        # Evaluates all points at once by numpy, the curve segments are
+        # evaluated by their Bernstein-Bézier form, see Basis.bernstein_form().
+        basis = self._basis
+        if isinstance(t, np.ndarray):  # copy, u will be modified
+            u = np.array(t, dtype=np.float64).reshape(-1)
+        else:
+            u = np.fromiter(t, dtype=np.float64)
+        max_t = basis.max_t
+        # same as math.isclose(u, max_t):
+        u[np.abs(u - max_t) <= 1e-9 * np.maximum(np.abs(u), abs(max_t))] = max_t
+        spans = basis.find_spans(u)
+        inside = basis.bernstein_mask(spans, u)
+        if np.all(inside):
+            xyz = self._bezier_points(spans, u)
+        else:
+            xyz = np.empty((len(u), 3))
+            xyz[inside] = self._bezier_points(spans[inside], u[inside])
+            outside = ~inside
+            control_points = np.array(
+                [v.xyz for v in self._control_points], dtype=np.float64
+            ).reshape(-1, 3)
+            spans = spans[outside]
+            N = basis.basis_funcs_array(spans, u[outside])
+            p = basis.degree
+            indices = spans[:, np.newaxis] - p + np.arange(p + 1)
+            xyz[outside] = np.einsum("ni,nij->nj", N, control_points[indices])
+        return xyz
+
+    def _get_homogeneous_control_points(self) -> np.ndarray:
+        # Returns the control points as contiguous (count, 4) array of
+        # homogeneous coordinates (x*w, y*w, z*w, w) for rational curves and
+        # as (count, 3) array for non-rational curves.
+        if self._homogeneous_control_points is None:
+            basis = self._basis
+            control_points = np.array(
+                [v.xyz for v in self._control_points], dtype=np.float64
+            ).reshape(-1, 3)
+            if basis.is_rational:
+                weights = np.array(basis.weights, dtype=np.float64)[:, np.newaxis]
+                control_points = np.hstack((control_points * weights, weights))
+            self._homogeneous_control_points = np.ascontiguousarray(control_points)
+        return self._homogeneous_control_points
+
+    def _get_segments(self) -> np.ndarray:
+        # Returns the Bézier control points of the curve segments of all knot
+        # spans as (count, dim, order) array, the segments of invalid knot
+        # spans are 0.
+        if self._segments is not None:
+            return self._segments
+        order = self._basis.order
+        coefficients = self._basis.bernstein_form()[1]
+        control_points = self._get_homogeneous_control_points()
+        indices = np.arange(len(coefficients))[:, np.newaxis] - order + 1
+        self._segments = np.einsum(
+            "sik,sid->sdk",
+            coefficients,
+            control_points[indices + np.arange(order)],
+        )
+        return self._segments
+
+    def _bezier_points(self, spans: np.ndarray, u: np.ndarray) -> np.ndarray:
+        basis = self._basis
+        bezier = self._get_segments()
+        knots = basis._knot_array
+        a = knots[spans]
+        points = bezier_eval_linear(bezier[spans], (u - a) / (knots[spans + 1] - a))
+        if basis.is_rational:
+            w = points[:, 3]
+            is_zero = w == 0.0
+            w[is_zero] = 1.0
+            points = points[:, :3] / w[:, np.newaxis]
+            points[is_zero] = 0.0
+        return points
 
     def derivative(self, u: float, n: int = 1) -> list[Vec3]:
         """Return point and derivatives up to n <= degree for parameter u."""
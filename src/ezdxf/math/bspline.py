@@ -874,7 +874,7 @@ class BSpline:
 
     """
 
-    __slots__ = ("_control_points", "_basis", "_clamped")
+    __slots__ = ("_control_points", "_basis", "_clamped", "_evaluator")
 
     def __init__(
         self,
@@ -904,6 +904,8 @@ class BSpline:
                 knots = normalize_knots(knots)
         self._basis = Basis(knots, order, count, weights=weights)
         self._clamped = len(set(knots[:order])) == 1 and len(set(knots[-order:])) == 1
+        # the evaluator caches data for point evaluation, the curve is immutable
+        self._evaluator: Optional[Evaluator] = None
 
     def __str__(self):
         return (
@@ -939,7 +941,11 @@ class BSpline:
 
     @property
     def evaluator(self) -> Evaluator:
-        return Evaluator(self._basis, self._control_points)
+        evaluator = self._evaluator
+        if evaluator is None:  # created at first use
+            evaluator = Evaluator(self._basis, self._control_points)
+            self._evaluator = evaluator
+        return evaluator
 
     @property
     def is_rational(self):
@@ -1046,6 +1052,16 @@ class BSpline:
         """
         return self.evaluator.points(self.params(segments))
 
+    def approximate_array(self, segments: int = 20) -> np.ndarray:
+        """Approximates curve by vertices as numpy array of shape (n, 3),
+        vertices count n = segments + 1. Same vertices as :meth:`approximate`
+        without the creation of :class:`Vec3` objects.
+
+        .. versionadded:: 1.2.1
+
+        """
+        return self.evaluator.points_array(self.params(segments))
+
     def params(self, segments: int) -> Iterable[float]:
         """Yield evenly spaced parameters for given segment count."""
         # works for clamped and unclamped curves
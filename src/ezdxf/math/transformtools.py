@@ -1,7 +1,7 @@
 # Copyright (c) 2020-2024, Manfred Moitzi
 # License: MIT License
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator
 import math
 from ezdxf.math import (
     Vec3,
@@ -172,6 +172,31 @@ class OCSTransform:
         """Returns vertex transformed from old OCS into new OCS."""
         return self.new_ocs.from_wcs(self.m.transform(self.old_ocs.to_wcs(vertex)))
 
+    def transform_vertices(self, vertices: Iterable[UVec]) -> Iterator[Vec3]:
+        """Returns vertices transformed from old OCS into new OCS.
+
+        Applies a single combined transformation matrix to all vertices, which is
+        faster than calling :meth:`transform_vertex` for each vertex.
+
+        """
+        return self.vertex_transformation().transform_vertices(vertices)
+
+    def vertex_transformation(self) -> Matrix44:
+        """Returns the combined transformation matrix for vertices from the old
+        OCS into the new OCS.
+        """
+        # OCS origin is ALWAYS the WCS origin!
+        matrices = [self.m]
+        if self.old_ocs.transform:  # OCS to WCS
+            matrices.insert(0, self.old_ocs.matrix)
+        if self.new_ocs.transform:  # WCS to OCS
+            wcs_to_ocs = self.new_ocs.matrix.copy()
+            wcs_to_ocs.transpose()
+            matrices.append(wcs_to_ocs)
+        if len(matrices) == 1:
+            return self.m
+        return Matrix44.chain(*matrices)
+
     def transform_2d_vertex(self, vertex: UVec, elevation: float) -> Vec2:
         """Returns 2D vertex transformed from old OCS into new OCS."""
         v = Vec3(vertex).replace(z=elevation)
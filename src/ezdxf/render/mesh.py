@@ -13,8 +13,13 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    cast,
 )
 from typing_extensions import TypeAlias
+from itertools import chain, repeat
+import heapq
+import math
+import numpy as np
 from ezdxf.math import (
     BoundingBox,
     Matrix44,
@@ -110,10 +115,20 @@ def all_edges(faces: Iterable[Face]) -> Iterator[Edge]:
 
 
 def face_edges(face: Face) -> Iterable[Edge]:
-    """Yields all edges of a single open face as int tuples."""
+    """Returns all edges of a single open face as int tuples."""
     size = len(face)
-    for index in range(size):
-        yield face[index], face[(index + 1) % size]
+    # unrolled for the most common triangle and quad faces:
+    if size == 3:
+        a, b, c = face
+        return (a, b), (b, c), (c, a)
+    if size == 4:
+        a, b, c, d = face
+        return (a, b), (b, c), (c, d), (d, a)
+    if size == 0:
+        return ()
+    edges = list(zip(face, face[1:]))
+    edges.append((face[-1], face[0]))
+    return edges
 
 
 def get_edge_stats(faces: Iterable[Face]) -> EdgeStats:
@@ -130,18 +145,109 @@ def get_edge_stats(faces: Iterable[Face]) -> EdgeStats:
     mixed face vertex orders.
 
     """
-    new_edge = EdgeStat(0, 0)
-    stats: EdgeStats = {}
-    for a, b in all_edges(faces):
-        edge = a, b
-        orientation = +1
-        if a > b:
-            edge = b, a
-            orientation = -1
-        # for all edges: count should be 2 and balance should be 0
-        count, balance = stats.get(edge, new_edge)
-        stats[edge] = EdgeStat(count + 1, balance + orientation)
-    return stats
+    return _edge_stats_dict(*_edge_stat_arrays(faces))
+
+
+def _edge_stats_dict(
+    starts: np.ndarray, ends: np.ndarray, counts: np.ndarray, balances: np.ndarray
+) -> EdgeStats:
+    return dict(
+        zip(
+            zip(starts.tolist(), ends.tolist()),
+            # same as EdgeStat._make() without the length check:
+            map(
+                tuple.__new__,
+                repeat(EdgeStat),
+                zip(counts.tolist(), balances.tolist()),
+            ),
+        )
+    )
+
+
+def _edge_stat_arrays(
+    faces: Iterable[Face],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the edge statistics as numpy arrays of the smaller vertex index,
+    the bigger vertex index, the edge count and the edge balance of the unique
+    edges in order of their first occurrence.
+    """
+    face_array = None
+    if isinstance(faces, (list, tuple)):
+        face_array = _homogeneous_faces(faces)
+    if face_array is not None:  # e.g. triangle or quad meshes
+        a = face_array.ravel()
+        b = np.roll(face_array, -1, axis=1).ravel()
+    else:
+        a, b = _ragged_face_edges(list(open_faces(faces)))
+        if len(a) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty, empty
+    orientation = np.where(a > b, -1, +1)
+    # pack the edges (min, max) into a single int64 key, the offset `base`
+    # supports also negative vertex indices:
+    base = min(a.min(), b.min())
+    keys = ((np.minimum(a, b) - base) << 32) | (np.maximum(a, b) - base)
+    unique_keys, first_index, inverse, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    balances = np.bincount(
+        inverse, weights=orientation, minlength=len(unique_keys)
+    ).astype(np.int64)
+    # for all edges: count should be 2 and balance should be 0
+    order = np.argsort(first_index)  # order of the first occurrence
+    unique_keys = unique_keys[order]
+    return (
+        (unique_keys >> 32) + base,
+        (unique_keys & 0xFFFFFFFF) + base,
+        counts[order],
+        balances[order],
+    )
+
+
+def _ragged_face_edges(faces: Sequence[Face]) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the start- and end vertex indices of all edges of open `faces`
+    with different vertex counts as two numpy arrays.
+    """
+    sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    ends = np.cumsum(sizes)
+    count = int(ends[-1]) if len(ends) else 0
+    starts = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=count)
+    # the next vertex of the last vertex of a face is the first vertex:
+    next_vertex = np.arange(1, len(starts) + 1)
+    next_vertex[ends - 1] = ends - sizes
+    return starts, starts[next_vertex]
+
+
+def _homogeneous_faces(faces: Sequence[Face]) -> Optional[np.ndarray]:
+    """Returns the `faces` as (F, K) numpy array if all faces are open faces
+    with the same count K of vertices, e.g. triangle or quad meshes, otherwise
+    returns ``None``.
+    """
+    if len(faces) == 0 or len(faces[0]) < 3:
+        return None
+    try:
+        face_array = np.array(faces, dtype=np.int64)
+    except (ValueError, TypeError):  # faces of different sizes
+        return None
+    if face_array.ndim != 2 or np.any(face_array[:, 0] == face_array[:, -1]):
+        return None
+    return face_array
+
+
+def _fast_face_normals(
+    xyz: np.ndarray, face_array: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the normal vectors of all faces calculated from the first three
+    vertices like the fast path of :func:`safe_normal_vector` and a mask of the
+    degenerated faces, the normal vector of degenerated faces is (0, 0, 0).
+    """
+    a = xyz[face_array[:, 0]]
+    normals = np.cross(xyz[face_array[:, 1]] - a, xyz[face_array[:, 2]] - a)
+    lengths = np.linalg.norm(normals, axis=1)
+    degenerated = lengths == 0.0
+    lengths[degenerated] = 1.0
+    normals /= lengths[:, np.newaxis]
+    return normals, degenerated
 
 
 def estimate_face_normals_direction(
@@ -233,11 +339,17 @@ def area_3d(polygon: Sequence[Vec3]) -> float:
 
 
 class MeshDiagnose:
+    __slots__ = ("_mesh", "_edge_stats", "_edge_arrays", "_bbox", "_face_normals")
+
     def __init__(self, mesh: MeshBuilder):
         self._mesh = mesh
-        self._edge_stats: EdgeStats = {}
+        self._edge_stats: Optional[EdgeStats] = None
+        # edge statistics as numpy arrays, see _edge_stat_arrays():
+        self._edge_arrays: Optional[
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        ] = None
         self._bbox = BoundingBox()
-        self._face_normals: list[Vec3] = []
+        self._face_normals: Optional[list[Vec3]] = None
 
     @property
     def vertices(self) -> Sequence[Vec3]:
@@ -255,7 +367,7 @@ class MeshDiagnose:
         instance is used as normal vector for degenerated faces. (cached data)
 
         """
-        if len(self._face_normals) == 0:
+        if self._face_normals is None:
             self._face_normals = list(self._mesh.face_normals())
         return self._face_normals
 
@@ -279,7 +391,21 @@ class MeshDiagnose:
     @property
     def n_edges(self) -> int:
         """Returns the unique edge count. (cached data)"""
-        return len(self.edge_stats)
+        return len(self._edge_counts_and_balances()[0])
+
+    def _edge_stat_arrays(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # computed once and shared by the topology checks and edge_stats
+        if self._edge_arrays is None:
+            self._edge_arrays = _edge_stat_arrays(self.faces)
+        return self._edge_arrays
+
+    def _edge_counts_and_balances(self) -> tuple[np.ndarray, np.ndarray]:
+        # The topology checks do not need the edge statistics as dict of
+        # EdgeStat tuples, which is expensive to build for big meshes.
+        _, _, counts, balances = self._edge_stat_arrays()
+        return counts, balances
 
     @property
     def edge_stats(self) -> EdgeStats:
@@ -289,8 +415,8 @@ class MeshDiagnose:
         balance, see :class:`EdgeStat` for the definition of edge count and
         edge balance. (cached data)
         """
-        if len(self._edge_stats) == 0:
-            self._edge_stats = get_edge_stats(self.faces)
+        if self._edge_stats is None:
+            self._edge_stats = _edge_stats_dict(*self._edge_stat_arrays())
         return self._edge_stats
 
     @property
@@ -313,7 +439,8 @@ class MeshDiagnose:
         more than two faces. (cached data)
 
         """
-        return any(e.balance != 0 for e in self.edge_stats.values())
+        _, balances = self._edge_counts_and_balances()
+        return bool(np.any(balances != 0))
 
     @property
     def is_manifold(self) -> bool:
@@ -322,7 +449,8 @@ class MeshDiagnose:
         A non-manifold mesh has edges with 3 or more connected faces.
 
         """
-        return all(edge.count < 3 for edge in self.edge_stats.values())
+        counts, _ = self._edge_counts_and_balances()
+        return bool(np.all(counts < 3))
 
     @property
     def is_closed_surface(self) -> bool:
@@ -334,18 +462,24 @@ class MeshDiagnose:
         Returns ``False`` for non-manifold meshes.
 
         """
-        return all(edge.count == 2 for edge in self.edge_stats.values())
+        counts, _ = self._edge_counts_and_balances()
+        return bool(np.all(counts == 2))
 
     def total_edge_count(self) -> int:
         """Returns the total edge count of all faces, shared edges are counted
         separately for each face. In closed surfaces this count should be 2x
         the unique edge count :attr:`n_edges`. (cached data)
         """
-        return sum(e.count for e in self.edge_stats.values())
+        counts, _ = self._edge_counts_and_balances()
+        return int(counts.sum())
 
     def unique_edges(self) -> Iterable[Edge]:
         """Yields the unique edges of the mesh as int 2-tuples. (cached data)"""
-        return self.edge_stats.keys()
+        if self._edge_stats is not None:
+            return self._edge_stats.keys()
+        # unpack the edges without building the EdgeStat tuples:
+        starts, ends, _, _ = self._edge_stat_arrays()
+        return zip(starts.tolist(), ends.tolist())
 
     def estimate_face_normals_direction(self) -> float:
         """Returns the estimated face-normals direction as ``float`` value
@@ -433,6 +567,8 @@ class MeshBuilder:
 
     """
 
+    __slots__ = ("vertices", "faces")
+
     def __init__(self) -> None:
         self.vertices: list[Vec3] = []
         # face storage, each face is a tuple of vertex indices (v0, v1, v2, v3, ....)
@@ -471,12 +607,30 @@ class MeshBuilder:
         """Yields all face normals, yields the ``NULLVEC`` instance for degenerated
         faces.
         """
+        face_array = _homogeneous_faces(self.faces)
+        if face_array is not None:
+            yield from self._homogeneous_face_normals(face_array)
+            return
         for face in self.faces_as_vertices():
             try:
                 yield safe_normal_vector(face)
             except (ValueError, ZeroDivisionError):
                 yield NULLVEC
 
+    def _homogeneous_face_normals(self, face_array: np.ndarray) -> Iterator[Vec3]:
+        # Same fast path as safe_normal_vector() for all faces at once, the
+        # normals of degenerated faces are calculated by the safe path.
+        normals, degenerated = _fast_face_normals(
+            _vertex_array(self.vertices), face_array
+        )
+        for index, (normal, is_degenerated) in enumerate(
+            zip(normals.tolist(), degenerated.tolist())
+        ):
+            if is_degenerated:
+                yield self.get_face_normal(index)
+            else:
+                yield Vec3(normal)
+
     def faces_as_vertices(self) -> Iterator[list[Vec3]]:
         """Yields all faces as list of vertices."""
         v = self.vertices
@@ -519,8 +673,16 @@ class MeshBuilder:
             tuple: indices of the `vertices` added to the :attr:`vertices` list
 
         """
+        if isinstance(vertices, np.ndarray):
+            # creating Vec3 objects from lists of Python floats is much faster
+            # than from numpy arrays:
+            vertices = vertices.tolist()
         start_index = len(self.vertices)
-        self.vertices.extend(Vec3.generate(vertices))
+        if isinstance(vertices, list) and all(type(v) is Vec3 for v in vertices):
+            # Vec3 objects are immutable and can be shared
+            self.vertices.extend(vertices)
+        else:
+            self.vertices.extend(Vec3.generate(vertices))
         return tuple(range(start_index, len(self.vertices)))
 
     def add_mesh(
@@ -543,7 +705,11 @@ class MeshBuilder:
 
         """
         if mesh is not None:
-            vertices = Vec3.list(mesh.vertices)
+            if isinstance(mesh, MeshBuilder):
+                # the vertices of a MeshBuilder are already Vec3 objects
+                vertices = mesh.vertices
+            else:
+                vertices = Vec3.list(mesh.vertices)
             faces = mesh.faces
 
         if vertices is None:
@@ -571,16 +737,18 @@ class MeshBuilder:
 
         """
         dxfattribs = dict(dxfattribs) if dxfattribs else {}
-        vertices = self.vertices
-        if matrix is not None:
-            vertices = matrix.transform_vertices(vertices)
-        if ucs is not None:
-            vertices = ucs.points_to_wcs(vertices)  # type: ignore
+        vertices: Sequence[UVec] = self.vertices
+        m = _render_matrix(matrix, ucs)
+        if m is not None:
+            # transform all vertices at once by a single matrix:
+            xyz = _vertex_array(self.vertices)
+            m.transform_array_inplace(xyz, 3)
+            vertices = xyz.tolist()
         mesh = layout.add_mesh(dxfattribs=dxfattribs)
         with mesh.edit_data() as data:
             # data will be copied at setting in edit_data()
             # ignore edges and creases!
-            data.vertices = list(vertices)
+            data.vertices = list(vertices)  # type: ignore
             data.faces = list(self.faces)
         return mesh
 
@@ -603,6 +771,12 @@ class MeshBuilder:
 
         """
         dxfattribs = dict(dxfattribs) if dxfattribs else {}
+        face_array = _homogeneous_faces(self.faces)
+        if face_array is not None:
+            self._render_homogeneous_normals(
+                layout, face_array, length, relative, dxfattribs
+            )
+            return
         for face in self.faces_as_vertices():
             count = len(face)
             if count < 3:
@@ -618,6 +792,40 @@ class MeshBuilder:
                 _length = length
             layout.add_line(center, center + n * _length, dxfattribs=dxfattribs)
 
+    def _render_homogeneous_normals(
+        self,
+        layout: GenericLayoutType,
+        face_array: np.ndarray,
+        length: float,
+        relative: bool,
+        dxfattribs,
+    ) -> None:
+        xyz = _vertex_array(self.vertices)
+        face_vertices = xyz[face_array]  # shape (F, K, 3)
+        centers = face_vertices.mean(axis=1)
+        normals, degenerated = _fast_face_normals(xyz, face_array)
+        if relative:
+            lengths = np.linalg.norm(face_vertices[:, 0] - centers, axis=1) * length
+        else:
+            lengths = np.full(len(face_array), float(length))
+        for index, (face_center, normal, _length, is_degenerated) in enumerate(
+            zip(
+                centers.tolist(),
+                normals.tolist(),
+                lengths.tolist(),
+                degenerated.tolist(),
+            )
+        ):
+            center = Vec3(face_center)
+            if is_degenerated:
+                try:
+                    n = safe_normal_vector(self.get_face_vertices(index))
+                except ZeroDivisionError:
+                    continue
+            else:
+                n = Vec3(normal)
+            layout.add_line(center, center + n * _length, dxfattribs=dxfattribs)
+
     @classmethod
     def from_mesh(cls: Type[T], other: Union[MeshBuilder, Mesh]) -> T:
         """Create new mesh from other mesh as class method.
@@ -685,10 +893,9 @@ class MeshBuilder:
         dxfattribs = dict(dxfattribs) if dxfattribs else {}
         polyface = layout.add_polyface(dxfattribs=dxfattribs)
         t = MeshTransformer.from_builder(self)
-        if matrix is not None:
-            t.transform(matrix)
-        if ucs is not None:
-            t.transform(ucs.matrix)
+        m = _render_matrix(matrix, ucs)
+        if m is not None:
+            t.transform(m)
         polyface.append_faces(
             t.tessellation(max_vertex_count=4),
             dxfattribs=dxfattribs,
@@ -748,10 +955,9 @@ class MeshBuilder:
         """
         dxfattribs = dict(dxfattribs) if dxfattribs else {}
         t = MeshTransformer.from_builder(self)
-        if matrix is not None:
-            t.transform(matrix)
-        if ucs is not None:
-            t.transform(ucs.matrix)
+        m = _render_matrix(matrix, ucs)
+        if m is not None:
+            t.transform(m)
         for face in t.tessellation(max_vertex_count=4):
             layout.add_3dface(face, dxfattribs=dxfattribs)
 
@@ -803,12 +1009,21 @@ class MeshBuilder:
     def optimize_vertices(self, precision: int = 6) -> MeshTransformer:
         """Returns a new mesh with optimized vertices. Coincident vertices are
         merged together and all faces are open faces (first vertex != last
-        vertex). Uses internally the :class:`MeshVertexMerger` class to merge
-        vertices.
+        vertex). The vertices are merged by the same rules as by the
+        :class:`MeshVertexMerger` class.
         """
-        mesh = MeshVertexMerger(precision=precision)
-        mesh.add_mesh(mesh=self)
-        return MeshTransformer.from_builder(mesh)
+        # The vertices are merged by sorting the rounded vertex array instead
+        # of a dict lookup for each vertex:
+        xyz = _vertex_array(self.vertices)
+        first_index, inverse = _merge_vertex_array(xyz, precision)
+        index_map: list[int] = inverse.tolist()
+
+        mesh = MeshTransformer()
+        mesh.vertices = Vec3.list(xyz[first_index].tolist())
+        mesh.faces = [
+            tuple(index_map[index] for index in face) for face in open_faces(self.faces)
+        ]
+        return mesh
 
     def subdivide_ngons(self, max_vertex_count=4) -> Iterator[Sequence[Vec3]]:
         """Yields all faces as sequence of :class:`~ezdxf.math.Vec3` instances,
@@ -944,6 +1159,50 @@ class MeshBuilder:
 class MeshTransformer(MeshBuilder):
     """A mesh builder with inplace transformation support."""
 
+    __slots__ = ("_xyz", "_vertices")
+
+    def __init__(self) -> None:
+        # The transformation methods work on a numpy array of the vertices,
+        # the list of Vec3 objects is rebuilt at the next access of the
+        # vertices attribute:
+        self._xyz: Optional[np.ndarray] = None
+        self._vertices: list[Vec3] = []
+        super().__init__()
+
+    @property  # type: ignore[override]
+    def vertices(self) -> list[Vec3]:
+        if self._xyz is not None:
+            self._vertices = Vec3.list(self._xyz.tolist())
+            self._xyz = None
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: list[Vec3]) -> None:
+        self._vertices = vertices
+        self._xyz = None
+
+    def _vertex_array(self) -> np.ndarray:
+        """Returns the vertices as (n, 3) numpy array, the array is modified
+        inplace by the transformation methods.
+        """
+        if self._xyz is None:
+            self._xyz = _vertex_array(self._vertices)
+        return self._xyz
+
+    def add_vertices(self, vertices: Iterable[UVec]) -> Face:
+        xyz = self._xyz
+        if (
+            xyz is not None
+            and isinstance(vertices, np.ndarray)
+            and vertices.ndim == 2
+            and vertices.shape[1] == 3
+        ):
+            # append to the vertex array without creating Vec3 objects
+            start_index = len(xyz)
+            self._xyz = np.concatenate((xyz, vertices.astype(np.float64)))
+            return tuple(range(start_index, len(self._xyz)))
+        return super().add_vertices(vertices)
+
     def transform(self, matrix: Matrix44):
         """Transform mesh inplace by applying the transformation `matrix`.
 
@@ -952,7 +1211,7 @@ class MeshTransformer(MeshBuilder):
                 object
 
         """
-        self.vertices = list(matrix.transform_vertices(self.vertices))
+        matrix.transform_array_inplace(self._vertex_array(), 3)
         return self
 
     def translate(self, dx: Union[float, UVec] = 0, dy: float = 0, dz: float = 0):
@@ -968,7 +1227,8 @@ class MeshTransformer(MeshBuilder):
             t = Vec3(dx, dy, dz)
         else:
             t = Vec3(dx)
-        self.vertices = [t + v for v in self.vertices]
+        xyz = self._vertex_array()
+        xyz += t.xyz
         return self
 
     def scale(self, sx: float = 1, sy: float = 1, sz: float = 1):
@@ -980,7 +1240,8 @@ class MeshTransformer(MeshBuilder):
             sz: scale factor for z-axis
 
         """
-        self.vertices = [Vec3(x * sx, y * sy, z * sz) for x, y, z in self.vertices]
+        xyz = self._vertex_array()
+        xyz *= (sx, sy, sz)
         return self
 
     def scale_uniform(self, s: float):
@@ -990,7 +1251,8 @@ class MeshTransformer(MeshBuilder):
             s: scale factor for x-, y- and z-axis
 
         """
-        self.vertices = [v * s for v in self.vertices]
+        xyz = self._vertex_array()
+        xyz *= s
         return self
 
     def rotate_x(self, angle: float):
@@ -1000,7 +1262,15 @@ class MeshTransformer(MeshBuilder):
             angle: rotation angle in radians
 
         """
-        self.vertices = list(Matrix44.x_rotate(angle).transform_vertices(self.vertices))
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        # fmt: off
+        self._rotate([
+            1., 0., 0.,
+            0., cos_a, sin_a,
+            0., -sin_a, cos_a,
+        ])
+        # fmt: on
         return self
 
     def rotate_y(self, angle: float):
@@ -1010,7 +1280,15 @@ class MeshTransformer(MeshBuilder):
             angle: rotation angle in radians
 
         """
-        self.vertices = list(Matrix44.y_rotate(angle).transform_vertices(self.vertices))
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        # fmt: off
+        self._rotate([
+            cos_a, 0., -sin_a,
+            0., 1., 0.,
+            sin_a, 0., cos_a,
+        ])
+        # fmt: on
         return self
 
     def rotate_z(self, angle: float):
@@ -1020,7 +1298,15 @@ class MeshTransformer(MeshBuilder):
             angle: rotation angle in radians
 
         """
-        self.vertices = list(Matrix44.z_rotate(angle).transform_vertices(self.vertices))
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        # fmt: off
+        self._rotate([
+            cos_a, sin_a, 0.,
+            -sin_a, cos_a, 0.,
+            0., 0., 1.,
+        ])
+        # fmt: on
         return self
 
     def rotate_axis(self, axis: UVec, angle: float):
@@ -1032,11 +1318,107 @@ class MeshTransformer(MeshBuilder):
             angle: rotation angle in radians
 
         """
-        self.vertices = list(
-            Matrix44.axis_rotate(axis, angle).transform_vertices(self.vertices)
-        )
+        c = math.cos(angle)
+        s = math.sin(angle)
+        omc = 1.0 - c
+        x, y, z = Vec3(axis).normalize()
+        # fmt: off
+        self._rotate([
+            x * x * omc + c, y * x * omc + z * s, x * z * omc - y * s,
+            x * y * omc - z * s, y * y * omc + c, y * z * omc + x * s,
+            x * z * omc + y * s, y * z * omc - x * s, z * z * omc + c,
+        ])
+        # fmt: on
         return self
 
+    def _rotate(self, m: Sequence[float]) -> None:
+        # Applies the 3x3 rotation matrix `m` in row-major order by a single
+        # matrix multiplication, same row vector convention as Matrix44
+        self._xyz = self._vertex_array() @ np.array(m, dtype=np.float64).reshape(3, 3)
+
+
+def _render_matrix(
+    matrix: Optional[Matrix44], ucs: Optional[UCS]
+) -> Optional[Matrix44]:
+    """Returns the transformation by `matrix` followed by the transformation
+    from `ucs` to WCS as a single matrix or ``None`` for no transformation.
+    """
+    if ucs is None:
+        return matrix
+    if matrix is None:
+        return ucs.matrix
+    return matrix * ucs.matrix
+
+
+def _merge_vertex_array(
+    xyz: np.ndarray, precision: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merges coincident vertices of the (n, 3) vertex array `xyz` by the same
+    rules as the :class:`MeshVertexMerger` class.
+
+    Returns the index of the first occurrence of each merged vertex in order of
+    their occurrence and the index of the merged vertex for each vertex in
+    `xyz`.
+
+    """
+    q = _quantized_vertex_array(xyz, precision)
+    if q is None:
+        _, first_index, inverse = np.unique(
+            np.round(xyz, precision), axis=0, return_index=True, return_inverse=True
+        )
+        return _first_occurrence_order(first_index, inverse.reshape(-1))
+    return _merge_quantized_vertices(q)
+
+
+def _quantized_vertex_array(xyz: np.ndarray, precision: int) -> Optional[np.ndarray]:
+    """Returns the vertices rounded to `precision` as (n, 3) int64 array, the
+    same integers as used by the :class:`MeshVertexMerger` ledger keys.
+    Returns ``None`` for empty arrays, NaN, inf or coordinates beyond the
+    integer precision of floats.
+    """
+    scaled = xyz * 10.0**precision
+    if len(xyz) == 0 or not np.all(np.abs(scaled) < 2.0**52):
+        return None
+    return np.rint(scaled).astype(np.int64)
+
+
+def _merge_quantized_vertices(q: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merges coincident vertices of the quantized (n, 3) vertex array `q`,
+    returns the same as :func:`_merge_vertex_array`.
+    """
+    q = q - q.min(axis=0)
+    bx, by, bz = (int(m).bit_length() for m in q.max(axis=0))
+    if bx + by + bz < 64:
+        # pack the quantized coordinates into a single int64 key:
+        keys = (q[:, 0] << (by + bz)) | (q[:, 1] << bz) | q[:, 2]
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        is_new = sorted_keys[1:] != sorted_keys[:-1]
+    else:
+        order = np.lexsort((q[:, 2], q[:, 1], q[:, 0]))  # stable sort
+        sorted_q = q[order]
+        is_new = np.any(sorted_q[1:] != sorted_q[:-1], axis=1)
+    is_first = np.concatenate(([True], is_new))
+    inverse = np.empty(len(q), dtype=np.int64)
+    inverse[order] = np.cumsum(is_first) - 1
+    return _first_occurrence_order(order[is_first], inverse)
+
+
+def _first_occurrence_order(
+    first_index: np.ndarray, inverse: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(first_index)
+    new_index = np.empty(len(order), dtype=np.int64)
+    new_index[order] = np.arange(len(order))
+    return first_index[order], new_index[inverse]
+
+
+def _vertex_array(vertices: Sequence[Vec3]) -> np.ndarray:
+    """Returns the `vertices` as (n, 3) numpy array."""
+    return np.fromiter(
+        chain.from_iterable(vertices), dtype=np.float64, count=len(vertices) * 3
+    ).reshape(-1, 3)
+
 
 def _subdivide(mesh, quads=True) -> MeshVertexMerger:
     """Returns a new :class:`MeshVertexMerger` object with subdivided faces
@@ -1055,6 +1437,10 @@ def _subdivide(mesh, quads=True) -> MeshVertexMerger:
     return new_mesh
 
 
+# MeshVertexMerger.add_vertices() merges bigger vertex batches by numpy:
+_MIN_VERTEX_BATCH_SIZE = 256
+
+
 class MeshVertexMerger(MeshBuilder):
     """Subclass of :class:`MeshBuilder`
 
@@ -1074,6 +1460,8 @@ class MeshVertexMerger(MeshBuilder):
 
     """
 
+    __slots__ = ("ledger", "precision")
+
     # can not support vertex transformation
     def __init__(self, precision: int = 6):
         """
@@ -1082,7 +1470,10 @@ class MeshVertexMerger(MeshBuilder):
 
         """
         super().__init__()
-        self.ledger: dict[Vec3, int] = {}
+        # The keys are the vertex coordinates scaled by 10**precision and
+        # rounded to integers, vertices with non-finite coordinates use the
+        # rounded Vec3 as key:
+        self.ledger: dict[Union[tuple[int, int, int], Vec3], int] = {}
         self.precision: int = precision
 
     def add_vertices(self, vertices: Iterable[UVec]) -> Face:
@@ -1098,19 +1489,65 @@ class MeshVertexMerger(MeshBuilder):
             indices of the added `vertices`
 
         """
-        indices = []
-        precision = self.precision
+        if (
+            isinstance(vertices, (list, tuple, np.ndarray))
+            and len(vertices) >= _MIN_VERTEX_BATCH_SIZE
+        ):
+            batch = self._add_vertex_batch(vertices)
+            if batch is not None:
+                return batch
+        indices: list[int] = []
+        scale = 10.0**self.precision
+        # bind frequently used methods to local names:
+        add_index = indices.append
+        add_vertex = self.vertices.append
+        # a single dict operation for existing and new vertices:
+        get_index = self.ledger.setdefault
+        count = len(self.vertices)
         for vertex in Vec3.generate(vertices):
-            key = vertex.round(precision)
+            x, y, z = vertex
             try:
-                indices.append(self.ledger[key])
-            except KeyError:
-                index = len(self.vertices)
-                self.vertices.append(vertex)
-                self.ledger[key] = index
-                indices.append(index)
+                key = round(x * scale), round(y * scale), round(z * scale)
+            except (OverflowError, ValueError):  # inf or NaN
+                key = vertex.round(self.precision)
+            index = get_index(key, count)
+            if index == count:  # new vertex
+                add_vertex(vertex)
+                count += 1
+            add_index(index)
         return tuple(indices)
 
+    def _add_vertex_batch(
+        self, vertices: Union[Sequence[UVec], np.ndarray]
+    ) -> Optional[Face]:
+        # Merges the coincident vertices of the batch by numpy, the ledger is
+        # only queried for the unique vertices of the batch.
+        if isinstance(vertices, np.ndarray):
+            vertices = vertices.tolist()
+        points: Sequence[Vec3]
+        if all(type(v) is Vec3 for v in vertices):
+            points = cast(Sequence[Vec3], vertices)
+        else:
+            points = Vec3.list(vertices)
+        q = _quantized_vertex_array(_vertex_array(points), self.precision)
+        if q is None:
+            return None
+        first_index, inverse = _merge_quantized_vertices(q)
+        unique_indices: list[int] = []
+        add_index = unique_indices.append
+        add_vertex = self.vertices.append
+        get_index = self.ledger.setdefault
+        count = len(self.vertices)
+        for key, index in zip(
+            map(tuple, q[first_index].tolist()), first_index.tolist()
+        ):
+            vertex_index = get_index(key, count)
+            if vertex_index == count:  # new vertex
+                add_vertex(points[index])
+                count += 1
+            add_index(vertex_index)
+        return tuple(np.array(unique_indices, dtype=np.int64)[inverse].tolist())
+
     def index(self, vertex: UVec) -> int:
         """Get index of `vertex`, raises :class:`IndexError` if not found.
 
@@ -1119,8 +1556,15 @@ class MeshVertexMerger(MeshBuilder):
 
         (internal API)
         """
+        scale = 10.0**self.precision
+        v = Vec3(vertex)
+        x, y, z = v
         try:
-            return self.ledger[Vec3(vertex).round(self.precision)]
+            key = round(x * scale), round(y * scale), round(z * scale)
+        except (OverflowError, ValueError):  # inf or NaN
+            key = v.round(self.precision)
+        try:
+            return self.ledger[key]
         except KeyError:
             raise IndexError(f"Vertex {str(vertex)} not found.")
 
@@ -1151,6 +1595,8 @@ class MeshAverageVertexMerger(MeshBuilder):
 
     """
 
+    __slots__ = ("ledger", "precision")
+
     # can not support vertex transformation
     def __init__(self, precision: int = 6):
         super().__init__()
@@ -1215,11 +1661,12 @@ class MeshAverageVertexMerger(MeshBuilder):
 
 
 class _XFace:
-    __slots__ = ("fingerprint", "indices", "_orientation")
+    __slots__ = ("fingerprint", "indices", "index_set", "_orientation")
 
     def __init__(self, indices: Face):
-        self.fingerprint: int = hash(indices)
+        self.fingerprint = _canonical_face_key(indices)
         self.indices: Face = indices
+        self.index_set = frozenset(indices)
         self._orientation: Vec3 = VEC3_SENTINEL
 
     def orientation(self, vertices: Sequence[Vec3], precision: int = 4) -> Vec3:
@@ -1236,22 +1683,34 @@ class _XFace:
         return self._orientation
 
 
+def _canonical_face_key(indices: Face) -> tuple[int, ...]:
+    # Rotated faces like (0, 1, 2) and (1, 2, 0) are the same face and get the
+    # same key, a reversed face has a different orientation.
+    start = indices.index(min(indices))
+    return tuple(indices[start:]) + tuple(indices[:start])
+
+
 def _merge_adjacent_coplanar_faces(
     vertices: list[Vec3], faces: list[Face], precision: int = 4
 ) -> MeshVertexMerger:
     oriented_faces: dict[Vec3, list[_XFace]] = {}
+    # positions of the faces in the oriented_faces lists for each vertex index:
+    vertex_faces: dict[Vec3, dict[int, list[int]]] = {}
     extended_faces: list[_XFace] = []
     for face in faces:
         if len(face) < 3:
             raise ValueError("found invalid face count < 3")
         xface = _XFace(face)
         extended_faces.append(xface)
-        oriented_faces.setdefault(xface.orientation(vertices, precision), []).append(
-            xface
-        )
-
-    mesh = MeshVertexMerger()
-    done = set()
+        orientation = xface.orientation(vertices, precision)
+        parallel_faces = oriented_faces.setdefault(orientation, [])
+        faces_of_vertex = vertex_faces.setdefault(orientation, {})
+        for index in xface.index_set:
+            faces_of_vertex.setdefault(index, []).append(len(parallel_faces))
+        parallel_faces.append(xface)
+
+    merged_faces: list[Face] = []
+    done: set[tuple[int, ...]] = set()
     for xface in extended_faces:
         if xface.fingerprint in done:
             continue
@@ -1259,11 +1718,29 @@ def _merge_adjacent_coplanar_faces(
         face = xface.indices
         orientation = xface.orientation(vertices, precision)
         parallel_faces = oriented_faces[orientation]
+        faces_of_vertex = vertex_faces[orientation]
         face_set = set(face)
-        for parallel_face in parallel_faces:
+        # Examine only parallel faces which share at least one vertex with the
+        # merged face, in the same order as stored in parallel_faces. Faces
+        # located before the current position are not examined again, even if
+        # they share vertices added by a later merge.
+        candidates: list[int] = []
+        queued: set[int] = set()
+
+        def add_candidates(indices: Iterable[int], current: int) -> None:
+            for index in indices:
+                for position in faces_of_vertex.get(index, tuple()):
+                    if position > current and position not in queued:
+                        queued.add(position)
+                        heapq.heappush(candidates, position)
+
+        add_candidates(face_set, -1)
+        while candidates:
+            position = heapq.heappop(candidates)
+            parallel_face = parallel_faces[position]
             if parallel_face.fingerprint in done:
                 continue
-            common_vertices = face_set.intersection(set(parallel_face.indices))
+            common_vertices = face_set.intersection(parallel_face.index_set)
             # connection by at least 2 vertices required:
             if len(common_vertices) > 1:
                 if len(common_vertices) == len(parallel_face.indices):
@@ -1274,9 +1751,20 @@ def _merge_adjacent_coplanar_faces(
                     except (NodeMergingError, DegeneratedPathError):
                         continue
                 done.add(parallel_face.fingerprint)
-                face_set = set(face)
-        v0 = list(remove_colinear_face_vertices([vertices[i] for i in face]))
-        mesh.add_face(v0)
+                new_face_set = set(face)
+                add_candidates(new_face_set.difference(face_set), position)
+                face_set = new_face_set
+        merged_faces.append(face)
+
+    mesh = MeshVertexMerger()
+    if len(merged_faces) == 0:
+        return mesh
+    # remove the colinear vertices of all merged faces at once:
+    indices = list(chain.from_iterable(merged_faces))
+    sizes = np.fromiter(map(len, merged_faces), dtype=np.int64, count=len(merged_faces))
+    xyz = _vertex_array(vertices)[indices]
+    for positions in _remove_colinear_vertices(xyz, sizes):
+        mesh.add_face([vertices[indices[i]] for i in positions])
     return mesh
 
 
@@ -1284,58 +1772,84 @@ VEC3_SENTINEL = Vec3(0, 0, 0)
 
 
 def remove_colinear_face_vertices(vertices: Sequence[Vec3]) -> Iterator[Vec3]:
-    def get_direction(v1: Vec3, v2: Vec3):
-        return (v2 - v1).normalize()
-
     if len(vertices) < 3:
         yield from vertices
         return
+    xyz = _vertex_array(vertices)
+    indices = _remove_colinear_vertices(xyz, np.array([len(vertices)]))[0]
+    for index in indices:
+        yield vertices[index]
 
-    # remove duplicated vertices
-    _vertices: list[Vec3] = [vertices[0]]
-    for v in vertices[1:]:
-        if not v.isclose(_vertices[-1]):
-            _vertices.append(v)
-
-    if len(_vertices) < 3:
-        if len(_vertices) == 1:
-            _vertices.append(_vertices[0])
-        yield from _vertices
-        return
 
-    start = _vertices[0]
-    prev_vertex = VEC3_SENTINEL
-    current_direction = VEC3_SENTINEL
-    start_index = 0
-
-    # find start direction
-    yield start
-    while current_direction is VEC3_SENTINEL:
-        start_index += 1
-        try:
-            prev_vertex = vertices[start_index]
-        except IndexError:
-            yield prev_vertex
-            return
-        current_direction = get_direction(start, prev_vertex)
-
-    yielded_anything = False
-    _vertices.append(start)
-    for vertex in _vertices[start_index:]:
-        try:
-            if get_direction(start, vertex).isclose(current_direction):
-                prev_vertex = vertex
-                continue
-        except ZeroDivisionError:
-            continue
-        yield prev_vertex
-        yielded_anything = True
-        start = prev_vertex
-        current_direction = get_direction(start, vertex)
-        prev_vertex = vertex
-
-    if not yielded_anything:
-        yield _vertices[-2]  # last vertex
+def _remove_colinear_vertices(xyz: np.ndarray, sizes: np.ndarray) -> list[list[int]]:
+    """Removes coincident and colinear vertices from multiple faces at once.
+    The (n, 3) array `xyz` contains the vertices of all faces, the array
+    `sizes` contains the vertex count of each face. Returns the indices of the
+    remaining vertices of each face, the first vertex of a face is always kept.
+    """
+    count = len(xyz)
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    is_start = np.zeros(count, dtype=bool)
+    is_start[starts] = True
+    # remove duplicated consecutive vertices:
+    is_duplicate = np.zeros(count, dtype=bool)
+    is_duplicate[1:] = _isclose_rows(xyz[1:], xyz[:-1])
+    keep = ~(is_duplicate & ~is_start)
+    face_ids = np.repeat(np.arange(len(sizes)), sizes)
+
+    # the face vertices without duplicates:
+    positions = np.flatnonzero(keep)
+    sizes = np.bincount(face_ids[positions], minlength=len(sizes))
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    # remove last vertex if equal to the first vertex (closed face):
+    first_vertices = xyz[positions[starts]]
+    last_vertices = xyz[positions[ends - 1]]
+    is_closing = (sizes > 2) & _isclose_rows(last_vertices, first_vertices)
+    keep[positions[ends[is_closing] - 1]] = False
+    positions = np.flatnonzero(keep)
+    sizes = sizes - is_closing
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+
+    # remove colinear vertices of faces with at least 3 vertices:
+    n = len(positions)
+    prev_index = np.arange(-1, n - 1)
+    prev_index[starts] = ends - 1
+    next_index = np.arange(1, n + 1)
+    next_index[ends - 1] = starts
+    v = xyz[positions]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        d_in = v - v[prev_index]
+        d_in /= np.linalg.norm(d_in, axis=1)[:, np.newaxis]
+        d_out = v[next_index] - v
+        d_out /= np.linalg.norm(d_out, axis=1)[:, np.newaxis]
+    is_colinear = _isclose_rows(d_in, d_out)
+    is_colinear[starts] = False
+    is_colinear[np.repeat(sizes < 3, sizes)] = False
+    positions = positions[~is_colinear].tolist()
+    sizes = np.bincount(
+        np.repeat(np.arange(len(sizes)), sizes)[~is_colinear], minlength=len(sizes)
+    ).tolist()
+
+    faces: list[list[int]] = []
+    start = 0
+    for size in sizes:
+        face = positions[start : start + size]
+        if size == 1:
+            face.append(face[0])
+        faces.append(face)
+        start += size
+    return faces
+
+
+def _isclose_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Compares the rows of the (n, 3) arrays `a` and `b` by the same rules as
+    :meth:`Vec3.isclose`, which is symmetric in contrast to :func:`numpy.isclose`.
+    """
+    tol = np.maximum(1e-9 * np.maximum(np.abs(a), np.abs(b)), 1e-12)
+    return np.all(np.abs(a - b) <= tol, axis=1)
 
 
 def merge_connected_paths(p1: Sequence[int], p2: Sequence[int]) -> Sequence[int]:
@@ -1349,6 +1863,7 @@ def merge_connected_paths(p1: Sequence[int], p2: Sequence[int]) -> Sequence[int]
     current_node = p1[0]
     finish = p1[0]
     connected_path = [current_node]
+    visited = {current_node}
     while True:
         try:
             next_node = current_path[current_node]
@@ -1359,10 +1874,11 @@ def merge_connected_paths(p1: Sequence[int], p2: Sequence[int]) -> Sequence[int]
         if next_node == finish:
             break
         current_node = next_node
-        if current_node in connected_path:
+        if current_node in visited:
             # node duplication is an error, e.g. two path are only connected
             # by one node:
             raise NodeMergingError
+        visited.add(current_node)
         connected_path.append(current_node)
 
     if len(connected_path) < 3:
@@ -1371,15 +1887,15 @@ def merge_connected_paths(p1: Sequence[int], p2: Sequence[int]) -> Sequence[int]
 
 
 def merge_full_patch(path: Sequence[int], patch: Sequence[int]):
-    count = len(path)
-    new_path = []
-    for pos, node in enumerate(path):
-        prev = path[pos - 1]
-        succ = path[(pos + 1) % count]
-        if prev in patch and succ in patch:
-            continue
-        new_path.append(node)
-    return new_path
+    patch_set = frozenset(patch)
+    nodes = list(path)
+    prev_nodes = nodes[-1:] + nodes[:-1]
+    next_nodes = nodes[1:] + nodes[:1]
+    return [
+        node
+        for prev, node, succ in zip(prev_nodes, nodes, next_nodes)
+        if not (prev in patch_set and succ in patch_set)
+    ]
 
 
 class Lump:
@@ -842,7 +842,7 @@ class MultiLeaderBuilder(abc.ABC):
         self._doc: "Drawing" = doc
         self._mleader_style: MLeaderStyle = style
         self._multileader = multileader
-        self._leaders: dict[ConnectionSide, list[list[Vec2]]] = defaultdict(
+        self._leaders: dict[ConnectionSide, list[list[Vec3]]] = defaultdict(
             list
         )
         self.set_mleader_style(style)
@@ -1053,10 +1053,11 @@ class MultiLeaderBuilder(abc.ABC):
             del self._multileader.dxf.arrow_head_handle
 
     def add_leader_line(
-        self, side: ConnectionSide, vertices: Iterable[Vec2]
+        self, side: ConnectionSide, vertices: Iterable[UVec]
     ) -> None:
         """Add leader as iterable of vertices in render UCS coordinates
-        (:ref:`WCS` by default).
+        (:ref:`WCS` by default). The vertices can also be a numpy array of
+        shape (n, 2) or (n, 3).
 
         .. note::
 
@@ -1069,7 +1070,8 @@ class MultiLeaderBuilder(abc.ABC):
             vertices: leader vertices
 
         """
-        self._leaders[side].append(list(vertices))
+        # convert the vertices only once and not at each build() call
+        self._leaders[side].append(Vec3.list(vertices))
 
     def build(
         self, insert: Vec2, rotation: float = 0.0, ucs: Optional[UCS] = None
@@ -1142,7 +1144,7 @@ class MultiLeaderBuilder(abc.ABC):
 
     def _build_leader(
         self,
-        leader_lines: list[list[Vec2]],
+        leader_lines: list[list[Vec3]],
         side: ConnectionSide,
         connection_point: Vec2,
         m: Matrix44,
@@ -1186,12 +1188,12 @@ class MultiLeaderBuilder(abc.ABC):
 
     @staticmethod
     def _append_leader_lines(
-        leader: LeaderData, leader_lines: list[list[Vec2]]
+        leader: LeaderData, leader_lines: list[list[Vec3]]
     ) -> None:
         for index, vertices in enumerate(leader_lines):
             line = LeaderLine()
             line.index = index
-            line.vertices = Vec3.list(vertices)
+            line.vertices = list(vertices)
             leader.lines.append(line)
 
 
@@ -21,6 +21,32 @@ def test_material_manager(doc):
     assert global_material.dxf.channel_flags == 63
 
 
+def test_material_names_are_case_insensitive(doc):
+    materials = doc.materials
+    assert "global" in materials
+    assert materials.get("GLOBAL") is materials.get("Global")
+    assert materials["gLoBaL"] is materials.get("Global")
+
+
+def test_create_many_materials():
+    materials = ezdxf.new("R2010").materials
+    count = len(materials)
+    new_materials = materials.new_many(["Wood", "Steel"])
+    assert [m.dxf.name for m in new_materials] == ["Wood", "Steel"]
+    assert len(materials) == count + 2
+    assert materials.get("Steel") is new_materials[1]
+    assert new_materials[0].dxf.owner == materials.handle
+
+
+@pytest.mark.parametrize("names", [["Glass", "global"], ["Glass", "GLASS"]])
+def test_create_many_materials_checks_all_names_in_advance(names):
+    materials = ezdxf.new("R2010").materials
+    count = len(materials)
+    with pytest.raises(ezdxf.DXFValueError):
+        materials.new_many(names)
+    assert len(materials) == count
+
+
 def test_export_matrix():
     from ezdxf.math import Matrix44
     from ezdxf.lldxf.tagwriter import TagCollector
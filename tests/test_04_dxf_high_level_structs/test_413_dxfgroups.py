@@ -78,5 +78,32 @@ def test_audit_filters_invalid_entities(doc):
     assert len(group) == 0
 
 
+def test_create_many_groups():
+    groups = ezdxf.new("R2010").groups
+    new_groups = groups.new_many(["A", None, "B"], description="test")
+    assert len(groups) == 3
+    assert groups.get("B") is new_groups[2]
+    assert new_groups[0].dxf.unnamed == 0
+    assert new_groups[1].dxf.unnamed == 1
+    assert new_groups[1] is groups.get("*A1")
+    assert all(g.dxf.description == "test" for g in new_groups)
+    assert all(g.dxf.owner == groups.handle for g in new_groups)
+
+
+def test_create_many_groups_checks_all_names_in_advance():
+    groups = ezdxf.new("R2010").groups
+    groups.new("A")
+    with pytest.raises(ezdxf.DXFValueError):
+        groups.new_many(["B", "a"])
+    assert len(groups) == 1
+
+
+def test_unnamed_groups_do_not_collide_with_new_names():
+    groups = ezdxf.new("R2010").groups
+    new_groups = groups.new_many([None, "*A1"])
+    assert new_groups[1] is groups.get("*A1")
+    assert new_groups[0] is groups.get("*A2")
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -546,3 +546,42 @@ def test_bspline_point_calculation_against_derivative_calculation():
     curve_points = [p[0] for p in spline.derivatives(PARAMS, n=1)]
     for p, expected in zip(curve_points, spline.points(PARAMS)):
         assert p.isclose(expected)
+
+
+@pytest.mark.parametrize("order", [2, 3, 4])
+@pytest.mark.parametrize("weights", [None, [1, 2, 0.5, 3, 1]])
+def test_approximate_matches_single_point_calculation(order, weights):
+    spline = BSpline(DEFPOINTS, order=order, weights=weights)
+    points = list(spline.approximate(30))
+    assert len(points) == 31
+    expected = [spline.point(t) for t in spline.params(30)]
+    assert close_vectors(points, expected)
+    assert points[-1].isclose(DEFPOINTS[-1])
+
+
+def test_repeated_approximation_reuses_evaluator():
+    spline = BSpline(DEFPOINTS, order=4, weights=[1, 2, 0.5, 3, 1])
+    assert spline.evaluator is spline.evaluator
+    first = list(spline.approximate(10))
+    assert list(spline.approximate(10)) == first
+    assert spline.point(spline.max_t).isclose(first[-1])
+
+
+def test_uniform_weights_do_not_change_the_curve():
+    spline = BSpline(DEFPOINTS, order=4)
+    rational_spline = BSpline(DEFPOINTS, order=4, weights=[2.5] * len(DEFPOINTS))
+    assert close_vectors(spline.approximate(20), rational_spline.approximate(20))
+
+
+@pytest.mark.parametrize("weights", [None, [1, 2, 0.5, 3, 1]])
+def test_approximate_array(weights):
+    spline = BSpline(DEFPOINTS, order=3, weights=weights)
+    points = spline.approximate_array(20)
+    assert isinstance(points, np.ndarray)
+    assert points.shape == (21, 3)
+    assert points.tolist() == [list(v) for v in spline.approximate(20)]
+
+
+def test_evaluate_empty_parameter_list():
+    spline = BSpline(DEFPOINTS, order=4)
+    assert list(spline.points([])) == []
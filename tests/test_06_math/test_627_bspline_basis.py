@@ -3,8 +3,10 @@
 
 import pytest
 import math
+import numpy as np
 from ezdxf.math.bspline import bspline_basis_vector, open_uniform_knot_vector
-from ezdxf.math._bspline import Basis
+from ezdxf.math._bspline import Basis, bezier_eval_linear, _basis_funcs
+from ezdxf.math.bezier import bernstein_basis
 from ezdxf.acc import USE_C_EXT
 
 basis_functions = [Basis]
@@ -64,5 +66,53 @@ def test_find_span(basis_cls):
     assert basis_func.find_span(basis_func.max_t) == 9
 
 
+@pytest.mark.parametrize(
+    "knots",
+    [
+        (0, 0, 0, 0, 1, 2, 2, 3, 4, 4, 4, 4),  # clamped with double knot
+        (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),  # unclamped
+    ],
+)
+def test_basis_funcs_array(knots):
+    basis = Basis(knots=knots, order=4, count=8, weights=[1, 2, 3, 1, 2, 1, 3, 1])
+    u = np.linspace(0, basis.max_t, 53)
+    spans = basis.find_spans(u)
+    assert spans.tolist() == [basis.find_span(t) for t in u]
+    result = basis.basis_funcs_array(spans, u)
+    for span, t, funcs in zip(spans, u, result):
+        assert np.allclose(funcs, basis.basis_funcs(span, t))
+
+
+def test_bernstein_form_is_cached():
+    basis = make_basic_func(10, 3, Basis)
+    valid, coefficients = basis.bernstein_form()
+    assert valid.tolist() == [False] * 3 + [True] * 7
+    assert coefficients.shape == (10, 4, 4)
+    assert basis.bernstein_form()[1] is coefficients
+
+
+@pytest.mark.parametrize("order", [2, 3, 4, 8])
+def test_bezier_eval_linear(order):
+    n = order - 1
+    t = np.linspace(0, 1, 11)
+    coefficients = np.arange(order * 2.0).reshape(1, 2, order) ** 2
+    coefficients = np.repeat(coefficients, len(t), axis=0)
+    result = bezier_eval_linear(coefficients, t)
+    for points, u in zip(result, t):
+        bernstein = [bernstein_basis(n, i, u) for i in range(order)]
+        for point, c in zip(points, coefficients[0]):
+            assert point == pytest.approx(np.dot(c, bernstein))
+
+
+@pytest.mark.parametrize("order", [3, 4])
+def test_unrolled_basis_funcs(order):
+    count = 8
+    basis = Basis(make_knots(count, order - 1), order=order, count=count)
+    for u in np.linspace(0, basis.max_t, 23):
+        span = basis.find_span(u)
+        expected = _basis_funcs(basis.knots, order, span, u)
+        assert basis.basis_funcs(span, u) == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -18,6 +18,23 @@ def test_transform_length_without_ocs():
     assert math.isclose(ocs.transform_length((0, 0, 2)), 2 * 4)
 
 
+@pytest.mark.parametrize(
+    "extrusion, m",
+    [
+        (Z_AXIS, Matrix44.translate(1, 2, 3)),
+        (Z_AXIS, Matrix44.axis_rotate(Vec3(1, 1, 1), 0.5)),
+        (Vec3(1, 1, 1), Matrix44.scale(-2, 1, 3)),
+        (Vec3(0, 1, -1), Matrix44.chain(Matrix44.x_rotate(1), Matrix44.scale(2))),
+    ],
+)
+def test_transform_vertices_is_equal_to_transform_vertex(extrusion, m):
+    ocs = OCSTransform(extrusion, m)
+    vertices = [Vec3(1, 2, 3), Vec3(-4, 5, 0), Vec3(0, 0, -7)]
+    result = list(ocs.transform_vertices(vertices))
+    expected = [ocs.transform_vertex(v) for v in vertices]
+    assert all(v0.isclose(v1) for v0, v1 in zip(result, expected))
+
+
 class TestTransformThickness:
     @pytest.mark.parametrize("thickness", [-2, 0, +2])
     def test_no_transformation(self, thickness):
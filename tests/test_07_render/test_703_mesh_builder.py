@@ -2,8 +2,9 @@
 # License: MIT License
 import pytest
 import math
+import numpy as np
 import ezdxf
-from ezdxf.math import Vec3, BoundingBox, Matrix44, close_vectors
+from ezdxf.math import Vec3, BoundingBox, Matrix44, close_vectors, NULLVEC, UCS
 from ezdxf.render import forms
 from ezdxf.addons.menger_sponge import MengerSponge
 from ezdxf.render.mesh import (
@@ -17,6 +18,7 @@ from ezdxf.render.mesh import (
     DegeneratedPathError,
     remove_colinear_face_vertices,
     all_edges,
+    face_edges,
     get_edge_stats,
     separate_meshes,
     face_normals_after_transformation,
@@ -27,6 +29,13 @@ from ezdxf.addons import SierpinskyPyramid
 from ezdxf.layouts import VirtualLayout
 
 
+@pytest.mark.parametrize(
+    "cls", [MeshBuilder, MeshTransformer, MeshVertexMerger, MeshAverageVertexMerger]
+)
+def test_mesh_builders_have_no_instance_dict(cls):
+    assert not hasattr(cls(), "__dict__")
+
+
 def test_vertex_merger_indices():
     merger = MeshVertexMerger()
     indices = merger.add_vertices([(1, 2, 3), (4, 5, 6)])
@@ -50,6 +59,29 @@ def test_vertex_merger_index_of():
         merger.index((7, 8, 9))
 
 
+def test_vertex_merger_batch_matches_single_vertices():
+    vertices = [Vec3(x / 3, y / 7, 1e-9 * x) for x in range(20) for y in range(20)] * 2
+    single = MeshVertexMerger()
+    indices = [single.add_vertices([v])[0] for v in vertices]
+    batch = MeshVertexMerger()
+    batch.add_vertices(vertices[:7])
+    assert batch.add_vertices(vertices) == tuple(indices)
+    assert batch.vertices == single.vertices
+    assert batch.ledger == single.ledger
+    assert batch.index(vertices[-1]) == indices[-1]
+
+
+def test_vertex_merger_accepts_non_finite_coordinates():
+    merger = MeshVertexMerger()
+    inf = math.inf
+    indices = merger.add_vertices([(inf, 0, 0), (1, 2, 3), (inf, 0, 0)])
+    assert indices == (0, 1, 0)
+    assert merger.index((inf, 0, 0)) == 0
+    # NaN vertices are never coincident, the same as in earlier versions
+    assert merger.add_vertices([(math.nan, 0, 0)]) == (2,)
+    assert len(merger.vertices) == 3
+
+
 def test_average_vertex_merger_indices():
     merger = MeshAverageVertexMerger()
     indices = merger.add_vertices([(1, 2, 3), (4, 5, 6)])
@@ -100,6 +132,32 @@ def test_average_vertex_merger():
     assert len(mesh.faces) == 1024
 
 
+def test_optimize_vertices_matches_vertex_merger():
+    pyramid = SierpinskyPyramid(level=4, sides=3)
+    faces = pyramid.faces()
+    mesh = MeshBuilder()
+    merger = MeshVertexMerger()
+    for vertices in pyramid:
+        mesh.add_mesh(vertices=vertices, faces=faces)
+        merger.add_mesh(vertices=vertices, faces=faces)
+    optimized = mesh.optimize_vertices()
+    assert isinstance(optimized, MeshTransformer)
+    assert len(optimized.vertices) == 514
+    assert optimized.vertices == merger.vertices
+    assert optimized.faces == merger.faces
+
+
+@pytest.mark.parametrize("size", [1.0, 12345.678, 1e15])
+def test_optimize_vertices_of_big_meshes(size):
+    # different strategies are used depending on the integer range of the
+    # quantized coordinates
+    mesh = forms.sphere(count=16, stacks=8).scale_uniform(size)
+    merger = MeshVertexMerger.from_mesh(mesh)
+    optimized = mesh.optimize_vertices()
+    assert optimized.vertices == merger.vertices
+    assert optimized.faces == merger.faces
+
+
 REGULAR_FACE = Vec3.list([(0, 0, 0), (1, 0, 1), (1, 1, 1), (0, 1, 0)])
 IRREGULAR_FACE = Vec3.list([(0, 0, 0), (1, 0, 1), (1, 1, 0), (0, 1, 0)])
 
@@ -120,6 +178,56 @@ def test_scale_mesh():
     assert bbox.extmax.isclose((2, 3, 4))
 
 
+def test_chained_transformations():
+    mesh = forms.cube(center=False)
+    mesh.scale(2, 3, 4).translate(1, 1, 1).scale_uniform(0.5)
+    mesh.transform(Matrix44.translate(-1, -1, -1))
+    bbox = BoundingBox(mesh.vertices)
+    assert bbox.extmin.isclose((-0.5, -0.5, -0.5))
+    assert bbox.extmax.isclose((0.5, 1.0, 1.5))
+    assert all(isinstance(v, Vec3) for v in mesh.vertices)
+
+
+def test_add_vertices_after_transformation():
+    mesh = forms.cube(center=False)
+    mesh.translate(1, 0, 0)
+    mesh.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+    assert len(mesh.vertices) == 11
+    assert mesh.vertices[0].isclose((1, 0, 0))
+    assert mesh.vertices[8].isclose((0, 0, 0))
+
+
+def test_add_vertex_array_after_transformation():
+    mesh = forms.cube(center=False)
+    mesh.translate(1, 0, 0)
+    indices = mesh.add_vertices(np.array([(0, 0, 0), (1, 2, 3)], dtype=np.int32))
+    assert indices == (8, 9)
+    mesh.translate(1, 0, 0)
+    assert mesh.vertices[0].isclose((2, 0, 0))
+    assert mesh.vertices[9].isclose((2, 2, 3))
+    assert all(isinstance(v, Vec3) for v in mesh.vertices)
+
+
+def test_add_mesh_shares_vec3_objects():
+    cube = forms.cube()
+    mesh = MeshBuilder.from_mesh(cube)
+    assert mesh.vertices == cube.vertices
+    assert mesh.vertices is not cube.vertices
+    assert all(v1 is v2 for v1, v2 in zip(mesh.vertices, cube.vertices))
+
+
+def test_add_mixed_vertices():
+    mesh = MeshBuilder()
+    mesh.add_vertices([Vec3(1, 2, 3), (4, 5, 6)])
+    assert all(type(v) is Vec3 for v in mesh.vertices)
+
+
+def test_add_vertex_array():
+    mesh = MeshBuilder()
+    assert mesh.add_vertices(np.array([(0, 0, 0), (1, 2, 3)])) == (0, 1)
+    assert mesh.vertices == [Vec3(0, 0, 0), Vec3(1, 2, 3)]
+
+
 def test_rotate_x():
     mesh = forms.cube(center=False)
     mesh.rotate_x(math.radians(90))
@@ -128,6 +236,28 @@ def test_rotate_x():
     assert bbox.extmax.isclose((1, 0, 1))
 
 
+@pytest.mark.parametrize(
+    "method, m",
+    [
+        ("rotate_y", Matrix44.y_rotate(0.7)),
+        ("rotate_z", Matrix44.z_rotate(0.7)),
+    ],
+)
+def test_rotations_match_matrix_transformation(method, m):
+    mesh = forms.cube()
+    getattr(mesh, method)(0.7)
+    expected = list(m.transform_vertices(forms.cube().vertices))
+    assert close_vectors(Vec3.list(mesh.vertices), expected)
+
+
+def test_rotate_axis():
+    mesh = forms.cube()
+    mesh.rotate_axis((1, 2, 3), 0.7)
+    m = Matrix44.axis_rotate((1, 2, 3), 0.7)
+    expected = list(m.transform_vertices(forms.cube().vertices))
+    assert close_vectors(Vec3.list(mesh.vertices), expected)
+
+
 def test_mesh_bounding_box():
     bbox = forms.cube().bbox()
     assert bbox.extmin.isclose((-0.5, -0.5, -0.5))
@@ -152,6 +282,19 @@ def test_get_face_normal():
     assert mesh.get_face_normal(-1).isclose((0, 0, 1)), "upward top face"
 
 
+def test_face_normals_of_quad_mesh_with_degenerated_faces():
+    mesh = MeshBuilder()
+    mesh.add_face([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    # first 3 vertices are collinear, the safe path uses all vertices
+    mesh.add_face([(0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 1, 0)])
+    # all vertices coincident
+    mesh.add_face([(0, 0, 0), (0, 0, 0), (0, 0, 0), (0, 0, 0)])
+    normals = list(mesh.face_normals())
+    assert normals[0].isclose((0, 0, 1))
+    assert normals[1].isclose((0, 0, 1))
+    assert normals[2] is NULLVEC
+
+
 class TestMeshDiagnose:
     def test_empty_mesh_is_not_watertight(self):
         mesh = MeshBuilder()
@@ -190,6 +333,32 @@ class TestMeshDiagnose:
         stats = mesh.diagnose()
         assert stats.total_edge_count() == stats.n_edges * 2
 
+    def test_edge_counts_match_edge_stats(self):
+        mesh = forms.cube()
+        mesh.faces.append(mesh.faces[0])
+        stats = mesh.diagnose()
+        assert stats.n_edges == len(stats.edge_stats) == 12
+        assert stats.total_edge_count() == 28
+        assert stats.is_manifold is False
+
+    def test_edge_stats_are_cached(self):
+        stats = forms.cube().diagnose()
+        assert stats.n_edges == 12
+        assert stats.edge_stats is stats.edge_stats
+
+    def test_unique_edges(self):
+        stats = forms.cube().diagnose()
+        edges = list(stats.unique_edges())
+        assert len(edges) == 12
+        assert edges == list(stats.edge_stats.keys())
+        assert list(stats.unique_edges()) == edges
+
+    def test_cached_data_of_empty_mesh(self):
+        stats = MeshBuilder().diagnose()
+        assert stats.edge_stats is stats.edge_stats
+        assert stats.face_normals is stats.face_normals
+        assert stats.n_edges == 0
+
     def test_cube_of_separated_faces_is_not_watertight(self):
         mesh = forms.cube(center=False)
         mesh2 = MeshBuilder()
@@ -308,6 +477,15 @@ def test_render_polyface(cube_polyface, msp):
     assert new_polyface.vertices[0] is not cube_polyface.vertices[0]
 
 
+def test_render_mesh_by_matrix_and_ucs(msp):
+    cube = forms.cube(center=False)
+    matrix = Matrix44.scale(2, 3, 4)
+    ucs = UCS(origin=(1, 2, 3), ux=(0, 1, 0), uy=(-1, 0, 0))
+    mesh = cube.render_mesh(msp, matrix=matrix, ucs=ucs)
+    expected = ucs.points_to_wcs(matrix.transform_vertices(cube.vertices))
+    assert close_vectors(Vec3.list(mesh.vertices), expected)
+
+
 def test_render_3dsolid():
     """Test if the render_3dsolid() method works.
 
@@ -524,6 +702,15 @@ def test_merge_coplanar_faces():
     assert len(optimized_cube.vertices) == 8
 
 
+def test_merge_coplanar_faces_ignores_rotated_duplicate_faces():
+    m = MeshBuilder()
+    m.vertices = [Vec3(0, 0), Vec3(1, 0), Vec3(1, 1), Vec3(0, 1), Vec3(2, 0), Vec3(2, 1)]
+    m.faces = [(0, 1, 2, 3), (1, 4, 5, 2), (2, 3, 0, 1)]
+    optimized = m.merge_coplanar_faces()
+    assert len(optimized.faces) == 1
+    assert len(optimized.vertices) == 4
+
+
 def test_merge_disk():
     m = MeshVertexMerger()
     vertices = list(forms.circle(8, close=True))
@@ -623,6 +810,10 @@ class TestMergeConnectedPaths:
         p = merge_connected_paths(p, p4)
         assert p == [1, 2, 3, 4, 5, 6, 7, 8]
 
+    def test_merge_long_path(self):
+        p = merge_connected_paths(list(range(1000)), [999, 998, 1000])
+        assert p == list(range(999)) + [1000, 999]
+
     def test_degenerated_path(self):
         """This creates a path [0, 1] which is invalid."""
         open_segments = [0, 1, 2, 3, 4, 5, 6, 7, 8]
@@ -695,6 +886,16 @@ class TestRemoveColinearVertices:
         ]
 
 
+    def test_leading_duplicated_vertices(self):
+        v = [Vec3(0, 0), Vec3(0, 0), Vec3(1, 0), Vec3(2, 0), Vec3(2, 2), Vec3(0, 0)]
+        assert list(remove_colinear_face_vertices(v)) == [v[0], v[3], v[4]]
+
+    def test_returns_input_objects(self):
+        v = Vec3.list([(0, 0), (1, 0), (2, 0), (2, 2)])
+        result = list(remove_colinear_face_vertices(v))
+        assert result[1] is v[2]
+
+
 class TestMergeFullPatch:
     @pytest.mark.parametrize(
         "seg",
@@ -709,6 +910,23 @@ class TestMergeFullPatch:
         res = merge_full_patch(open_pie, seg)
         assert res == [1, 2, 3, 4, 5, 6, 7, 8]
 
+    def test_patch_in_the_middle_of_the_path(self):
+        path = list(range(100))
+        patch = tuple(range(60, 9, -1))
+        res = merge_full_patch(path, patch)
+        assert res == list(range(11)) + list(range(60, 100))
+
+    def test_short_paths(self):
+        assert merge_full_patch([], [1, 2]) == []
+        assert merge_full_patch((1, 2, 3), (1, 3)) == [1, 3]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5, 8])
+def test_edges_of_open_face(size):
+    face = tuple(range(size))
+    edges = list(all_edges([face]) if size > 2 else face_edges(face))
+    assert edges == [(i, (i + 1) % size) for i in range(size)]
+
 
 def test_all_edges_cube():
     mesh = forms.cube()
@@ -749,6 +967,19 @@ class TestGetEdgeStats:
         edges = get_edge_stats(faces)
         assert all(e[1] != 0 for e in edges.values()) is True
 
+    def test_faces_of_different_sizes(self):
+        faces = [(0, 1, 2, 3), (3, 2, 4), (0, 1, 2, 0), (5, 6)]
+        edges = get_edge_stats(faces)
+        assert edges == {
+            (0, 1): (2, 2),
+            (1, 2): (2, 2),
+            (2, 3): (2, 0),
+            (0, 3): (1, -1),
+            (2, 4): (1, 1),
+            (3, 4): (1, -1),
+            (0, 2): (1, -1),
+        }
+
 
 class TestSeparateMeshes:
     def test_separate_a_single_cube_returns_a_single_cube(self):
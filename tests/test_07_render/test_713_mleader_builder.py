@@ -2,8 +2,9 @@
 #  License: MIT License
 
 import pytest
+import numpy as np
 import ezdxf
-from ezdxf.math import Vec2
+from ezdxf.math import Vec2, Vec3
 from ezdxf.render import mleader
 from ezdxf.entities import MultiLeader
 
@@ -34,6 +35,17 @@ class TestMultiLeaderMTextBuilder:
         assert ml.context.mtext is not None
         assert ml.context.mtext.default_content == "line1"
 
+    def test_add_leader_line_from_numpy_array(self, doc):
+        ml = make_multi_leader(doc)
+        builder = mleader.MultiLeaderMTextBuilder(ml)
+        builder.set_content("line1")
+        builder.add_leader_line(
+            mleader.ConnectionSide.left, np.array([(-20, 10), (-10, 0)])
+        )
+        builder.build(insert=Vec2(0, 0))
+        vertices = ml.context.leaders[0].lines[0].vertices
+        assert vertices == [Vec3(-20, 10), Vec3(-10, 0)]
+
 
 class TestMultiLeaderBlockBuilder:
     """The MultiLeaderBlockBuilder is a construction tool to build the
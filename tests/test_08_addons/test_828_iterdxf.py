@@ -0,0 +1,243 @@
+# Copyright (c) 2024, Manfred Moitzi
+# License: MIT License
+import pytest
+import io
+
+import ezdxf
+from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.lldxf.tagger import tag_compiler
+from ezdxf.lldxf.types import DXFBinaryTag
+from ezdxf.addons import iterdxf
+from ezdxf.addons.iterdxf import (
+    binary_tagger,
+    _binary_lines,
+    _compiled_binary_tags,
+    _copy_data,
+)
+
+try:
+    from ezdxf.acc import tagger as acc_tagger
+except ImportError:
+    acc_tagger = None
+
+
+@pytest.fixture(params=["python", "cython"])
+def compiler(request):
+    if request.param == "python":
+        return _compiled_binary_tags
+    if acc_tagger is None:
+        pytest.skip("C-extension ezdxf.acc.tagger not available")
+    return acc_tagger.compiled_binary_tags
+
+
+def compiled_tags(compiler, data: bytes, encoding="cp1252"):
+    return compiler(_binary_lines(io.BytesIO(data)), encoding)
+
+
+def python_tags(data: bytes, encoding="cp1252"):
+    return tag_compiler(binary_tagger(io.BytesIO(data), encoding))
+
+
+def until_endsec(tags):
+    # both tag iterators raise an exception at the end of the stream
+    result = []
+    for tag in tags:
+        result.append(tag)
+        if tag == (0, "ENDSEC"):
+            break
+    return result
+
+
+ENDSEC = b"  0\r\nENDSEC\r\n"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # 3D point
+        b" 10\r\n1.0\r\n 20\r\n2.0\r\n 30\r\n3.0\r\n",
+        # 2D point followed by a regular tag
+        b" 10\r\n1.0\r\n 20\r\n2.0\r\n 62\r\n7\r\n",
+        # 2D point followed by another point
+        b" 10\r\n1.0\r\n 20\r\n2.0\r\n 11\r\n4\r\n 21\r\n5\r\n 31\r\n6\r\n",
+        # 2D point followed by a structure tag
+        b" 10\r\n1.0\r\n 20\r\n2.0\r\n",
+        # ProE stores int values as floats
+        b" 62\r\n1.0\r\n 70\r\n-2.0\r\n",
+        # binary data
+        b"310\r\nFEFE00\r\n",
+        # negative group code
+        b" -1\r\nX\r\n",
+        # group codes above 1071
+        b"1100\r\nX\r\n3000\r\nY\r\n",
+        # structure tags are stripped
+        b"  0\r\n LINE \r\n  8\r\n 0 \r\n",
+    ],
+)
+def test_compiled_binary_tags_are_equal_to_python_implementation(compiler, data):
+    data = data + ENDSEC
+    expected = until_endsec(python_tags(data))
+    assert until_endsec(compiled_tags(compiler, data)) == expected
+
+
+def test_compiled_binary_tags_with_line_feed_line_endings(compiler):
+    data = b"  0\nLINE\n 10\n1.0\n 20\n2.0\n 62\n1\n  0\nENDSEC\n"
+    expected = until_endsec(python_tags(data))
+    assert until_endsec(compiled_tags(compiler, data)) == expected
+
+
+def test_compiled_binary_tags_decodes_text(compiler):
+    data = "  1\r\nÄÖÜ\r\n".encode("cp1252") + ENDSEC
+    assert until_endsec(compiled_tags(compiler, data))[0] == (1, "ÄÖÜ")
+
+
+def test_compiled_binary_tags_returns_binary_tags(compiler):
+    tags = until_endsec(compiled_tags(compiler, b"310\r\nFEFE\r\n" + ENDSEC))
+    assert isinstance(tags[0], DXFBinaryTag)
+    assert tags[0].value == b"\xfe\xfe"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b" 10\r\n1.0\r\n 30\r\n2.0\r\n",  # missing y code
+        b" 10\r\n1.0\r\n",  # incomplete point
+        b" 10\r\nX\r\n 20\r\n2.0\r\n",  # invalid coordinate
+        b" 62\r\nX\r\n",  # invalid int value
+        b" 40\r\nX\r\n",  # invalid float value
+        b"  x\r\nX\r\n",  # invalid group code
+        b"310\r\nFEF\r\n",  # invalid binary data
+    ],
+)
+def test_compiled_binary_tags_raises_structure_error(compiler, data):
+    with pytest.raises(DXFStructureError):
+        until_endsec(compiled_tags(compiler, data + ENDSEC))
+    with pytest.raises(DXFStructureError):
+        until_endsec(python_tags(data + ENDSEC))
+
+
+def test_compiled_binary_tags_raises_exception_at_end_of_stream(compiler):
+    with pytest.raises(DXFStructureError):
+        list(compiled_tags(compiler, b"  0\r\nLINE\r\n"))
+
+
+def add_entities(layout, layer: str):
+    layout.add_blockref("BLK", (0, 0), dxfattribs={"layer": layer})
+    layout.add_polyline3d(
+        [(0, 0, 0), (1, 0, 0), (1, 1, 0)], dxfattribs={"layer": layer}
+    )
+    insert = layout.add_blockref("BLK", (1, 1), dxfattribs={"layer": layer})
+    insert.add_attrib("TAG1", "value1")
+    insert.add_attrib("TAG2", "value2")
+    layout.add_line((0, 0), (1, 0), dxfattribs={"layer": layer})
+
+
+@pytest.fixture(scope="module", params=["R12", "R2000"])
+def filename(request, tmp_path_factory):
+    doc = ezdxf.new(request.param)
+    doc.blocks.new("BLK")
+    msp = doc.modelspace()
+    add_entities(msp, "MSP")
+    add_entities(doc.paperspace(), "PSP")
+    # entities with paperspace flag in between modelspace entities:
+    add_entities(msp, "PSP")
+    for e in list(msp)[-4:]:
+        e.dxf.paperspace = 1
+    add_entities(msp, "MSP")
+    filename = tmp_path_factory.mktemp(request.param) / "iterdxf.dxf"
+    doc.saveas(filename)
+    return filename
+
+
+def opendxf_modelspace(filename):
+    doc = iterdxf.opendxf(filename)
+    yield from doc.modelspace()
+    doc.close()
+
+
+def single_pass_modelspace(filename):
+    with open(filename, "rb") as fp:
+        yield from iterdxf.single_pass_modelspace(fp)
+
+
+@pytest.mark.parametrize(
+    "load", [iterdxf.modelspace, opendxf_modelspace, single_pass_modelspace]
+)
+def test_iterate_modelspace_entities_only(load, filename):
+    entities = list(load(filename))
+    assert [e.dxftype() for e in entities] == [
+        "INSERT",
+        "POLYLINE",
+        "INSERT",
+        "LINE",
+    ] * 2
+    assert all(e.dxf.layer == "MSP" for e in entities)
+
+    polyline = entities[1]
+    assert len(polyline.vertices) == 3
+    assert polyline.seqend is not None
+
+    insert = entities[2]
+    assert [attrib.dxf.tag for attrib in insert.attribs] == ["TAG1", "TAG2"]
+    assert entities[0].attribs == []
+
+
+def test_export_modelspace_entities(filename, tmp_path):
+    export_name = tmp_path / "export.dxf"
+    doc = iterdxf.opendxf(filename)
+    exporter = doc.export(export_name)
+    for entity in doc.modelspace():
+        exporter.write(entity)
+    exporter.close()
+    doc.close()
+
+    result = ezdxf.readfile(export_name)
+    entities = list(result.modelspace())
+    assert [e.dxftype() for e in entities] == [
+        "INSERT",
+        "POLYLINE",
+        "INSERT",
+        "LINE",
+    ] * 2
+    assert len(entities[1].vertices) == 3
+    assert [attrib.dxf.tag for attrib in entities[2].attribs] == ["TAG1", "TAG2"]
+    assert "BLK" in result.blocks
+    assert len(result.paperspace()) == 0
+
+
+DATA = bytes(range(256)) * 10
+
+
+@pytest.fixture
+def source(tmp_path):
+    name = tmp_path / "source.bin"
+    name.write_bytes(DATA)
+    with open(name, "rb") as fp:
+        yield fp
+
+
+def test_copy_data_to_file(source, tmp_path):
+    name = tmp_path / "target.bin"
+    # buffered data has to be written before the copied data
+    with open(name, "wb") as target:
+        target.write(b"head")
+        _copy_data(source, 100, 1000, target)
+        target.write(b"tail")
+    assert name.read_bytes() == b"head" + DATA[100:1100] + b"tail"
+
+
+def test_copy_data_to_stream_without_file_descriptor(source):
+    target = io.BytesIO()
+    target.write(b"head")
+    _copy_data(source, 100, 1000, target)
+    assert target.getvalue() == b"head" + DATA[100:1100]
+
+
+def test_copy_data_stops_at_end_of_source(source):
+    target = io.BytesIO()
+    _copy_data(source, len(DATA) - 10, 1000, target)
+    assert target.getvalue() == DATA[-10:]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -76,6 +76,26 @@ def test_basis_funcs(py_basis, cy_basis, t_vector):
         )
 
 
+def test_basis_funcs_of_multiple_knots():
+    knots = (0, 0, 0, 0, 1, 2, 2, 3, 3, 3, 4, 4, 4, 4)
+    py_basis = PyBasis(knots, ORDER, COUNT)
+    cy_basis = CyBasis(knots, ORDER, COUNT)
+    for u in np.linspace(0, 4, 33):
+        span = py_basis.find_span(u)
+        assert cy_basis.find_span(u) == span
+        p = py_basis.basis_funcs(span, u)
+        c = cy_basis.basis_funcs(span, u)
+        assert all(math.isclose(a, b, abs_tol=1e-12) for a, b in zip(p, c))
+
+
+def test_basis_funcs_of_coincident_knots_raise_zero_division_error():
+    knots = (0, 0, 0, 0, 1, 2, 2, 3, 3, 3, 4, 4, 4, 4)
+    with pytest.raises(ZeroDivisionError):
+        PyBasis(knots, ORDER, COUNT).basis_funcs(5, 2.0)
+    with pytest.raises(ZeroDivisionError):
+        CyBasis(knots, ORDER, COUNT).basis_funcs(5, 2.0)
+
+
 def test_basis_vector(py_basis, cy_basis, t_vector):
     for u in t_vector:
         p = py_basis.basis_vector(u)
@@ -136,6 +156,17 @@ def test_point_evaluator(py_eval, cy_eval, t_vector):
     assert close_vectors(py_points, cy_points) is True
 
 
+def test_points_of_unsorted_parameters(cy_weval):
+    t = [5.5, 0.0, 13.0, 3.2, 3.9, 3.1, 12.0, 7.0, 6.99]
+    assert list(cy_weval.points(t)) == [cy_weval.point(u) for u in t]
+
+
+def test_points_array(py_weval, cy_weval, t_vector):
+    cy_points = cy_weval.points_array(t_vector)
+    assert cy_points.tolist() == [list(v) for v in cy_weval.points(t_vector)]
+    assert np.allclose(cy_points, py_weval.points_array(t_vector))
+
+
 def test_derivative_evaluator(py_eval, cy_eval, t_vector):
     py_ders = list(py_eval.derivatives(t_vector, 2))
     cy_ders = list(cy_eval.derivatives(t_vector, 2))
@@ -0,0 +1,107 @@
+#  Copyright (c) 2024, Manfred Moitzi
+#  License: MIT License
+import pytest
+import io
+import sys
+from itertools import islice
+
+pytest.importorskip("ezdxf.acc.tagger")
+
+from ezdxf.acc.tagger import binary_tags as cy_binary_tags
+from ezdxf.lldxf.tagger import tag_compiler as py_tag_compiler
+from ezdxf.lldxf.tagger import ascii_tags_loader
+from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.acc.tagger import compiled_binary_tags as cy_compiled_binary_tags
+from ezdxf.addons.iterdxf import _binary_lines
+
+DATA = b"""  0\r
+LINE\r
+  5\r
+FF\r
+ 62\r
+1.0\r
+ 10\r
+1.0\r
+ 20\r
+2.0\r
+ 30\r
+3.0\r
+ 11\r
+4.0\r
+ 21\r
+5.0\r
+310\r
+FEFE\r
+-1\r
+X\r
+  0\r
+ENDSEC\r
+"""
+
+
+def lines(data: bytes):
+    return _binary_lines(io.BytesIO(data))
+
+
+def compile_tags(data: bytes):
+    # compiled_binary_tags() raises an exception at the end of the stream
+    result = []
+    for tag in cy_compiled_binary_tags(lines(data), "cp1252"):
+        result.append(tag)
+        if tag == (0, "ENDSEC"):
+            break
+    return result
+
+
+def test_binary_tags_without_decoding():
+    tags = cy_binary_tags(lines(b"  0\nLINE\n"))
+    tag = next(tags)
+    assert tag == (0, b"LINE")
+
+
+def test_binary_tags_with_decoding():
+    tags = cy_binary_tags(lines("  1\nÄÖÜ\r\n".encode("cp1252")), "cp1252")
+    assert next(tags) == (1, "ÄÖÜ")
+
+
+def test_structure_tags_are_interned():
+    tags = cy_binary_tags(lines(b"  0\nSEQEND\n"), "cp1252")
+    assert next(tags).value is sys.intern("SEQEND")
+
+
+def test_binary_tags_raises_exception_at_end_of_stream():
+    with pytest.raises(DXFStructureError):
+        list(cy_binary_tags(lines(b"  0\nEOF\n")))
+
+
+@pytest.mark.parametrize("code", [b"", b"  ", b"x", b"1x", b"- 1", b"1 2"])
+def test_binary_tags_invalid_group_code(code):
+    with pytest.raises(DXFStructureError):
+        next(cy_binary_tags(lines(code + b"\nvalue\n")))
+
+
+def test_compiled_tags_are_equal_to_python_implementation():
+    text = DATA.decode().replace("\r\n", "\n")
+    py_tags = py_tag_compiler(ascii_tags_loader(io.StringIO(text)))
+    assert compile_tags(DATA) == list(py_tags)
+
+
+def test_compiled_binary_tags_are_equal_to_python_implementation():
+    text = DATA.decode().replace("\r\n", "\n")
+    py_tags = list(py_tag_compiler(ascii_tags_loader(io.StringIO(text))))
+    cy_tags = cy_compiled_binary_tags(lines(DATA), "cp1252")
+    assert list(islice(cy_tags, len(py_tags))) == py_tags
+
+
+def test_compiled_binary_tags_converts_floats_to_int():
+    tags = compile_tags(DATA)
+    assert tags[2] == (62, 1)
+
+
+def test_compiled_binary_tags_invalid_float_value():
+    with pytest.raises(DXFStructureError):
+        list(cy_compiled_binary_tags(lines(b" 40\nX\n"), "cp1252"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])